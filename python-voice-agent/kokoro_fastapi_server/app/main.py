@@ -1,11 +1,14 @@
 import os
+import json
 import uuid
+import struct
 import logging
+import threading
 import numpy as np
-import soundfile as sf
 from pathlib import Path
 from fastapi import FastAPI, Form, HTTPException
-from fastapi.responses import FileResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
 from fastapi.middleware.cors import CORSMiddleware
 
 # Import Kokoro TTS
@@ -28,11 +31,46 @@ app.add_middleware(
 
 # Initialize Kokoro model (singleton)
 kokoro_model = None
+_synthesis_lock = threading.Lock()
 VOICE_MAP = {
     "adina": "af_heart",
     "raffa": "am_michael",  # Updated to Michael's voice per user preference
     "default": "af_heart"
 }
+# Raw Kokoro voice model names (American male/female) passed through unmapped
+_RAW_VOICE_PREFIXES = ("am_", "af_")
+
+# Canonical 44-byte PCM WAV header (RIFF, a 16-byte fmt chunk, then data)
+_WAV_STRUCT = struct.Struct("<4sI4s4sIHHIIHH4sI")
+_WAV_SAMPLE_RATE = 24000  # Kokoro default sample rate
+_WAV_CHANNELS = 1
+_WAV_BITS_PER_SAMPLE = 16
+
+
+def samples_to_wav(chunks, sample_rate: int = _WAV_SAMPLE_RATE) -> bytearray:
+    """
+    Encode consecutive mono sample chunks as one 16-bit PCM WAV using a single allocation.
+
+    Float samples are expected to be scaled to the int16 range already. Each
+    chunk is converted straight into its slot of the WAV data region, so there
+    is no concatenated or intermediate int16 array to copy again.
+    """
+    header_size = _WAV_STRUCT.size
+    data_length = sum(chunk.size for chunk in chunks) * 2
+    buf = bytearray(header_size + data_length)
+    block_align = _WAV_CHANNELS * _WAV_BITS_PER_SAMPLE // 8
+    _WAV_STRUCT.pack_into(
+        buf, 0, b"RIFF", 36 + data_length, b"WAVE", b"fmt ", 16, 1,
+        _WAV_CHANNELS, sample_rate, sample_rate * block_align, block_align,
+        _WAV_BITS_PER_SAMPLE, b"data", data_length,
+    )
+    pcm = np.frombuffer(buf, dtype="<i2", offset=header_size)
+    offset = 0
+    for chunk in chunks:
+        np.copyto(pcm[offset:offset + chunk.size], chunk.reshape(-1), casting="unsafe")
+        offset += chunk.size
+    return buf
+
 
 def get_kokoro_model():
     """Get or initialize Kokoro model singleton"""
@@ -49,14 +87,42 @@ async def startup_event():
     get_kokoro_model()
     logger.info("🚀 Kokoro FastAPI server started")
 
+# /health is polled by the dashboard monitors and never changes, so its JSON
+# body is encoded once at import instead of on every request
+_HEALTH_BODY = json.dumps({
+    "status": "healthy",
+    "service": "kokoro-tts-server",
+    "voices": list(VOICE_MAP.keys())
+}, separators=(",", ":")).encode()
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "service": "kokoro-tts-server",
-        "voices": list(VOICE_MAP.keys())
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+def _render_wav(model, text: str, kokoro_voice: str, speed: float):
+    """Run Kokoro synthesis and encode the result as WAV (blocking; call off the event loop)."""
+    # Generate audio with Kokoro, one synthesis at a time as before
+    # Use the correct KPipeline calling pattern
+    with _synthesis_lock:
+        audio_chunks = [audio for gs, ps, audio in model(text, voice=kokoro_voice, speed=speed)]
+    
+    if not audio_chunks:
+        raise Exception("No audio generated")
+    chunks = [np.asarray(chunk) for chunk in audio_chunks]
+    sample_rate = _WAV_SAMPLE_RATE
+    
+    # Scale float output to the 16-bit range in place, clipping so peaks
+    # above 1.0 don't wrap around when converted to int16
+    for chunk in chunks:
+        if chunk.dtype != np.int16:
+            np.multiply(chunk, 32767, out=chunk)
+            np.clip(chunk, -32768, 32767, out=chunk)
+    
+    # Build the WAV in memory, converting each chunk directly into its data
+    # region rather than concatenating the chunks into one array first
+    wav_data = samples_to_wav(chunks, sample_rate=sample_rate)
+    return wav_data, sum(chunk.size for chunk in chunks), sample_rate
 
 @app.post("/synthesize")
 async def synthesize(
@@ -85,47 +151,26 @@ async def synthesize(
         
         # Map voice name to Kokoro voice
         # First check if it's a raw Kokoro voice model name (for voice samples)
-        if voice.startswith("am_") or voice.startswith("af_"):
+        if voice.startswith(_RAW_VOICE_PREFIXES):
             kokoro_voice = voice  # Use raw voice model name directly
             logger.info(f"🎵 Using raw Kokoro voice model: {kokoro_voice}")
         else:
             kokoro_voice = VOICE_MAP.get(voice.lower(), VOICE_MAP["default"])
             logger.info(f"🎭 Using mapped voice: {voice} -> {kokoro_voice}")
         
-        # Generate audio with Kokoro
-        # Use the correct KPipeline calling pattern
-        audio_gen = model(text, voice=kokoro_voice, speed=speed)
-        
-        # Collect all audio chunks from generator
-        audio_chunks = []
-        for gs, ps, audio in audio_gen:
-            # audio is already a numpy array
-            audio_chunks.append(audio)
-        
-        # Concatenate all chunks
-        if audio_chunks:
-            samples = np.concatenate(audio_chunks, axis=0)
-            sample_rate = 24000  # Kokoro default sample rate
-        else:
-            raise Exception("No audio generated")
-        
-        # Convert to 16-bit PCM if needed
-        if samples.dtype != np.int16:
-            samples = (samples * 32767).astype(np.int16)
-        
-        # Create temporary output file
-        output_path = f"/tmp/kokoro_{uuid.uuid4()}_output.wav"
-        
-        # Save as WAV file
-        sf.write(output_path, samples, sample_rate)
+        # Inference and PCM/WAV encoding are CPU-bound; run them on the
+        # threadpool so /health and other requests aren't stalled meanwhile
+        wav_data, num_samples, sample_rate = await run_in_threadpool(
+            _render_wav, model, text, kokoro_voice, speed
+        )
         
-        logger.info(f"✅ Generated {len(samples)} samples at {sample_rate}Hz → {output_path}")
+        logger.info(f"✅ Generated {num_samples} samples at {sample_rate}Hz ({len(wav_data)} bytes)")
         
         # Return audio file
-        return FileResponse(
-            output_path, 
+        return Response(
+            content=memoryview(wav_data),
             media_type="audio/wav",
-            filename=f"kokoro_audio_{uuid.uuid4().hex[:8]}.wav"
+            headers={"Content-Disposition": f'attachment; filename="kokoro_audio_{uuid.uuid4().hex[:8]}.wav"'}
         )
         
     except Exception as e:
@@ -12,9 +12,9 @@ import asyncio
 import logging
 import os
 import numpy as np
-import wave
-import io
-from typing import AsyncIterable, AsyncGenerator
+import re
+import struct
+from typing import AsyncIterable, AsyncGenerator, Iterator
 from dotenv import load_dotenv
 
 from livekit.agents import (
@@ -36,6 +36,7 @@ from spiritual_voice_agent.services.websocket import get_websocket_manager
 from datetime import datetime
 import time
 import httpx
+import orjson
 
 load_dotenv()
 logging.basicConfig(
@@ -44,6 +45,79 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Long LLM output is flushed to TTS at a natural phrase boundary rather than mid-word.
+# One precompiled pass finds every candidate break: after , ; : or before a conjunction.
+_MAX_TTS_BUFFER = 100
+_MIN_TTS_PHRASE = 20
+_SENTENCE_END = frozenset(".!?\n")
+# Optionally speak a response's opening clause as soon as it ends, so time-to-first-audio
+# doesn't scale with the first sentence's length. Off by default: the clause is then
+# synthesized on its own and loses the intonation it would carry across the sentence.
+_EARLY_FIRST_CLAUSE = os.getenv("TTS_EARLY_FIRST_CLAUSE", "").lower() in ("1", "true", "yes")
+_CLAUSE_END = frozenset(",;:")
+# Phrases with no letters or digits (stray "...", dashes, emoji) would only come back
+# as silence, so they are dropped before a Kokoro request is made for them.
+_SPEAKABLE_RE = re.compile(r"[^\W_]")
+_NATURAL_BREAK_RE = re.compile(r"[,;:](?=\s)|\s(?=(?:and|but|or|so|then|now|here)\s)")
+
+
+def _split_at_natural_break(text: str, max_length: int = _MAX_TTS_BUFFER) -> tuple[str, str]:
+    """Split text into (phrase, remainder) at the last natural break before max_length."""
+    split_at = -1
+    for match in _NATURAL_BREAK_RE.finditer(text, _MIN_TTS_PHRASE, max_length):
+        split_at = match.end()
+    if split_at < 0:
+        split_at = text.rfind(" ", _MIN_TTS_PHRASE, max_length)
+    if split_at < 0:
+        return text, ""
+    return text[:split_at].strip(), text[split_at:].lstrip()
+
+
+# One pooled HTTP client per agent process for Kokoro synthesis and dashboard
+# broadcasts, so each phrase reuses a keep-alive connection instead of a new one
+_http_client = None
+# Kokoro renders one request at a time, so a phrase can wait behind the one before it;
+# allow for that instead of httpx's 5 s default, but still fail a hung server fast
+_HTTP_TIMEOUT = httpx.Timeout(20.0, connect=2.0)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# RIFF/WAVE layout used to read Kokoro responses without the wave module
+_RIFF_HEADER = struct.Struct("<4sI4s")
+_CHUNK_HEADER = struct.Struct("<4sI")
+_FMT_FIELDS = struct.Struct("<HHI")  # audio format, channels, sample rate
+# The 44-byte header Kokoro actually sends (RIFF, a 16-byte fmt chunk, then data),
+# read with one unpack before falling back to walking the chunks
+_CANONICAL_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+# Bytes 8-40 of that header ("WAVE", the fmt chunk and the data chunk id) are
+# identical for every response from one voice; only the sizes around them vary
+_CANONICAL_WAV_FORMAT = slice(8, 40)
+_DATA_SIZE = struct.Struct("<I")
+
+# Quiet 440 Hz fallback beep played when Kokoro fails. It never changes, so the
+# samples are rendered once here rather than re-synthesized on every failure.
+_FALLBACK_BEEP_RATE = 16000
+_FALLBACK_BEEP = (
+    np.sin(2 * np.pi * 440 * np.linspace(0, 0.2, int(0.2 * _FALLBACK_BEEP_RATE), False)) * 0.1 * 32767
+).astype(np.int16)
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=_HTTP_TIMEOUT,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared HTTP client when the job shuts down"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
 
 
 class CustomTTSAgent(Agent):
@@ -77,6 +151,16 @@ class CustomTTSAgent(Agent):
         self.selected_voice = self.voice_map.get(character, "adina")
         logger.info(f"🎵 Voice selected: {self.selected_voice} for character {self.character}")
         
+        # Technical metadata fields that are the same on every stored turn
+        self._turn_metadata_base = {
+            "character": self.character,
+            "tts_engine": "kokoro",
+            "voice": self.selected_voice,
+        }
+        
+        # Format bytes, sample rate and channels of this voice's last canonical WAV
+        self._wav_format = None
+        
         # REAL DATA COLLECTION - Initialize conversation tracking
         self.conversation_tracker = None
         self.performance_tracker = get_performance_tracker()
@@ -87,6 +171,9 @@ class CustomTTSAgent(Agent):
         self.pending_user_input = None
         self.conversation_turn = 0
         
+        # In-flight dashboard performance broadcasts, held so they aren't collected early
+        self._broadcast_tasks = set()
+        
         logger.info("🔗 CustomTTSAgent initialized with REAL data collection!")
     
     async def on_session_start(self, session):
@@ -119,9 +206,7 @@ class CustomTTSAgent(Agent):
             logger.info(f"👤 User: BSK ({self.current_user_id[:8]}...)")
             
         except Exception as e:
-            logger.error(f"❌ Failed to initialize conversation tracking: {e}")
-            import traceback
-            logger.error(f"Full error: {traceback.format_exc()}")
+            logger.exception(f"❌ Failed to initialize conversation tracking: {e}")
     
     async def on_user_turn_completed(self, chat_ctx, new_message=None):
         """Capture user input when turn is completed - FIXED SIGNATURE"""
@@ -218,9 +303,7 @@ class CustomTTSAgent(Agent):
                     )
                     logger.info(f"✅ TRACKED CONVERSATION TURN - WebSocket should broadcast now!")
                 except Exception as e:
-                    logger.error(f"❌ Failed to track conversation turn: {e}")
-                    import traceback
-                    logger.error(f"❌ Full error: {traceback.format_exc()}")
+                    logger.exception(f"❌ Failed to track conversation turn: {e}")
             else:
                 logger.warning(f"⚠️ Cannot track turn: tracker={bool(self.conversation_tracker)}, session={bool(self.current_session_id)}")
                 
@@ -270,59 +353,92 @@ class CustomTTSAgent(Agent):
         """
         logger.info("🎵 Custom TTS node activated - using Kokoro TTS with REAL data collection")
         
-        text_buffer = ""
-        full_response = ""  # Track complete agent response for data collection
+        response_parts = []  # Track complete agent response for data collection (joined once at the end)
         
-        async for text_chunk in text:
-            if not text_chunk.strip():
-                continue
-                
-            # Add to buffer and full response
-            text_buffer += text_chunk
-            full_response += text_chunk
-            logger.info(f"📝 Buffered: '{text_buffer[:50]}...' (len: {len(text_buffer)})")
-            
-            # Check if we have a complete sentence or enough text
-            should_synthesize = (
-                text_buffer.endswith(('.', '!', '?', '\n')) or  # Complete sentence
-                len(text_buffer) > 100 or  # Long enough chunk
-                text_chunk.endswith('\n')  # Paragraph break
-            )
-            
-            if should_synthesize and text_buffer.strip():
-                logger.info(f"🎤 Synthesizing buffered text: '{text_buffer[:50]}...'")
+        # Phrases are split off the LLM stream by a background reader that starts their
+        # Kokoro requests; this generator awaits them in order, so the next phrase is
+        # already synthesizing while the current one's frames are played out. The reader
+        # holds a slot per phrase until it has been played, which keeps exactly one phrase
+        # of lookahead rather than queueing the whole reply on the Kokoro server.
+        # A None entry marks the end of the text.
+        pending_synthesis: asyncio.Queue = asyncio.Queue()
+        synthesis_slots = asyncio.Semaphore(2)  # the phrase playing plus the next one
+        
+        async def split_phrases():
+            text_buffer = ""
+            first_phrase = _EARLY_FIRST_CLAUSE
+            try:
+                async for text_chunk in text:
+                    if not text_chunk.strip():
+                        continue
+                        
+                    # Add to buffer and full response
+                    text_buffer += text_chunk
+                    response_parts.append(text_chunk)
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(f"📝 Buffered: '{text_buffer[:50]}...' (len: {len(text_buffer)})")
+                    
+                    # Flush complete sentences whole; split over-long text at a natural break
+                    phrase = None
+                    if text_buffer[-1] in _SENTENCE_END or text_chunk[-1] == '\n':
+                        phrase, text_buffer = text_buffer, ""
+                    elif first_phrase and text_buffer[-1] in _CLAUSE_END and len(text_buffer) >= _MIN_TTS_PHRASE:
+                        phrase, text_buffer = text_buffer, ""
+                    elif len(text_buffer) > _MAX_TTS_BUFFER:
+                        phrase, text_buffer = _split_at_natural_break(text_buffer)
+                    
+                    if phrase and _SPEAKABLE_RE.search(phrase):
+                        first_phrase = False
+                        if logger.isEnabledFor(logging.INFO):
+                            logger.info(f"🎤 Synthesizing buffered text: '{phrase[:50]}...'")
+                        await synthesis_slots.acquire()
+                        pending_synthesis.put_nowait(
+                            asyncio.create_task(self._synthesize_with_kokoro(phrase.strip()))
+                        )
                 
+                # Synthesize any remaining text in buffer at the end
+                if _SPEAKABLE_RE.search(text_buffer):
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(f"🎤 Synthesizing final buffer: '{text_buffer[:50]}...'")
+                    await synthesis_slots.acquire()
+                    pending_synthesis.put_nowait(
+                        asyncio.create_task(self._synthesize_with_kokoro(text_buffer.strip()))
+                    )
+            finally:
+                pending_synthesis.put_nowait(None)
+        
+        reader = asyncio.create_task(split_phrases())
+        try:
+            while (synthesis := await pending_synthesis.get()) is not None:
                 try:
-                    # Generate audio with Kokoro TTS
-                    audio_frames = await self._synthesize_with_kokoro(text_buffer.strip())
-                    
-                    # Yield each audio frame
+                    # Yield each audio frame as it is cut from the synthesized audio
+                    audio_frames = await synthesis
+                    frame_count = 0
                     for frame in audio_frames:
                         yield frame
+                        frame_count += 1
                         
-                    logger.info(f"✅ Generated {len(audio_frames)} audio frames for buffered text")
-                    
-                    # Clear buffer after successful synthesis
-                    text_buffer = ""
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(f"✅ Generated {frame_count} audio frames for buffered text")
                     
                 except Exception as e:
                     logger.error(f"❌ Custom TTS synthesis failed: {e}")
                     # Yield silence as fallback but keep trying
                     yield self._create_silence_frame()
-                    text_buffer = ""  # Clear buffer to avoid getting stuck
+                finally:
+                    synthesis_slots.release()
+            
+            # Surface any error from reading the LLM text stream
+            await reader
+        finally:
+            # On interruption, stop reading text and drop phrases not yet spoken
+            reader.cancel()
+            while not pending_synthesis.empty():
+                synthesis = pending_synthesis.get_nowait()
+                if synthesis is not None:
+                    synthesis.cancel()
         
-        # Synthesize any remaining text in buffer at the end
-        if text_buffer.strip():
-            full_response += text_buffer  # Add final buffer to complete response
-            logger.info(f"🎤 Synthesizing final buffer: '{text_buffer[:50]}...'")
-            try:
-                audio_frames = await self._synthesize_with_kokoro(text_buffer.strip())
-                for frame in audio_frames:
-                    yield frame
-                logger.info(f"✅ Generated {len(audio_frames)} audio frames for final buffer")
-            except Exception as e:
-                logger.error(f"❌ Final buffer synthesis failed: {e}")
-                yield self._create_silence_frame()
+        full_response = "".join(response_parts).strip()
         
         # 📊 COMPLETE PERFORMANCE TRACKING
         if self.current_conversation_id:
@@ -340,135 +456,156 @@ class CustomTTSAgent(Agent):
                 )
                 logger.info(f"📊 Performance metrics recorded: {breakdown.total}ms total")
                 
-                # 🚀 BROADCAST METRICS TO DASHBOARD
-                try:
-                    await self._broadcast_performance_metrics(breakdown)
-                except Exception as e:
-                    logger.error(f"❌ Failed to broadcast metrics to dashboard: {e}")
+                # 🚀 BROADCAST METRICS TO DASHBOARD (fire-and-forget, off the voice path)
+                broadcast = asyncio.create_task(self._broadcast_performance_metrics(breakdown))
+                self._broadcast_tasks.add(broadcast)
+                broadcast.add_done_callback(self._broadcast_tasks.discard)
                 
             except Exception as e:
                 logger.error(f"❌ Failed to record performance metrics: {e}")
         
         # 🔗 REAL DATA COLLECTION - Store conversation turn in Supabase
-        logger.info(f"🔍 Checking conversation storage: pending_input={bool(self.pending_user_input)}, response_length={len(full_response.strip()) if full_response else 0}")
+        logger.info(f"🔍 Checking conversation storage: pending_input={bool(self.pending_user_input)}, response_length={len(full_response)}")
         
-        if self.pending_user_input and full_response.strip():
+        if self.pending_user_input and full_response:
             logger.info(f"💾 STORING CONVERSATION TURN:")
             logger.info(f"   👤 User: '{self.pending_user_input[:60]}...'")
-            logger.info(f"   🤖 Adina: '{full_response.strip()[:60]}...'")
+            logger.info(f"   🤖 Adina: '{full_response[:60]}...'")
             
             await self._store_conversation_turn(
                 user_input=self.pending_user_input,
-                agent_response=full_response.strip()
+                agent_response=full_response
             )
             self.pending_user_input = None  # Clear after storing
         else:
             if not self.pending_user_input:
                 logger.warning("⚠️ No user input pending - conversation not stored")
-            if not full_response.strip():
+            if not full_response:
                 logger.warning("⚠️ No agent response - conversation not stored")
     
-    async def _synthesize_with_kokoro(self, text: str) -> list[rtc.AudioFrame]:
+    async def _synthesize_with_kokoro(self, text: str) -> Iterator[rtc.AudioFrame]:
         """Synthesize speech using Kokoro TTS via local FastAPI server"""
         logger.info(f"🎤 Kokoro TTS: '{text[:40]}{'...' if len(text) > 40 else ''}'")
         
         try:
-            import httpx
-            
             # Call local Kokoro TTS API
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "http://localhost:8001/synthesize",
-                    data={
-                        "text": text,
-                        "voice": self.selected_voice  # Dynamic voice based on character
-                    }
-                )
+            response = await _get_http_client().post(
+                "http://localhost:8001/synthesize",
+                data={
+                    "text": text,
+                    "voice": self.selected_voice  # Dynamic voice based on character
+                }
+            )
+            
+            if response.status_code == 200:
+                audio_bytes = response.content
+                logger.info(f"✅ Kokoro API success: {len(audio_bytes)} bytes")
                 
-                if response.status_code == 200:
-                    audio_bytes = response.content
-                    logger.info(f"✅ Kokoro API success: {len(audio_bytes)} bytes")
-                    
-                    # Convert bytes to numpy array
-                    audio_array = self._wav_bytes_to_array(audio_bytes)
-                    if audio_array is not None:
-                        logger.info(f"🔊 Audio array: {len(audio_array)} samples")
-                        return self._audio_to_frames(audio_array, sample_rate=24000)  # Kokoro outputs 24kHz
-                    else:
-                        logger.warning("⚠️ Failed to convert audio bytes, using fallback")
-                        return await self._generate_fallback_beep()
+                # Convert bytes to numpy array
+                audio_array = self._wav_bytes_to_array(audio_bytes)
+                if audio_array is not None:
+                    logger.info(f"🔊 Audio array: {len(audio_array)} samples")
+                    return self._audio_to_frames(audio_array, sample_rate=24000)  # Kokoro outputs 24kHz
                 else:
-                    logger.warning(f"⚠️ Kokoro API error: {response.status_code} - {response.text}")
+                    logger.warning("⚠️ Failed to convert audio bytes, using fallback")
                     return await self._generate_fallback_beep()
+            else:
+                logger.warning(f"⚠️ Kokoro API error: {response.status_code} - {response.text}")
+                return await self._generate_fallback_beep()
                 
         except Exception as e:
             logger.warning(f"⚠️ Kokoro API error: {e}, using fallback beep")
             return await self._generate_fallback_beep()
     
-    async def _generate_fallback_beep(self) -> list[rtc.AudioFrame]:
+    async def _generate_fallback_beep(self) -> Iterator[rtc.AudioFrame]:
         """Generate quiet fallback beep if Kokoro fails"""
-        duration = 0.2
-        sample_rate = 16000
-        samples = int(duration * sample_rate)
-        t = np.linspace(0, duration, samples, False)
-        audio = np.sin(2 * np.pi * 440 * t) * 0.1  # Quiet beep
-        audio_int16 = (audio * 32767).astype(np.int16)
-        return self._audio_to_frames(audio_int16, sample_rate=sample_rate)
+        return self._audio_to_frames(_FALLBACK_BEEP, sample_rate=_FALLBACK_BEEP_RATE)
 
     def _wav_bytes_to_array(self, wav_bytes: bytes) -> np.ndarray:
         """Convert WAV bytes to numpy array"""
         try:
-            # Create a BytesIO object from the WAV bytes
-            audio_io = io.BytesIO(wav_bytes)
+            # Same format as the voice's previous response: only the data size is new
+            if self._wav_format is not None and len(wav_bytes) >= _CANONICAL_WAV_HEADER.size:
+                format_bytes, sample_rate, channels = self._wav_format
+                if wav_bytes[:4] == b"RIFF" and wav_bytes[_CANONICAL_WAV_FORMAT] == format_bytes:
+                    data_size, = _DATA_SIZE.unpack_from(wav_bytes, _CANONICAL_WAV_FORMAT.stop)
+                    return self._pcm_view(wav_bytes, _CANONICAL_WAV_HEADER.size, data_size, sample_rate, channels)
             
-            # Read the WAV file
-            with wave.open(audio_io, 'rb') as wav_file:
-                # Get audio parameters
-                frames = wav_file.getnframes()
-                sample_rate = wav_file.getframerate()
-                channels = wav_file.getnchannels()
-                
-                logger.info(f"📊 WAV format: {frames} frames, {sample_rate}Hz, {channels} channels")
-                
-                # Read audio data
-                audio_data = wav_file.readframes(frames)
-                
-                # Convert to numpy array (16-bit PCM)
-                audio_array = np.frombuffer(audio_data, dtype=np.int16)
+            # Fast path: Kokoro's canonical header parsed with a single unpack
+            if len(wav_bytes) >= _CANONICAL_WAV_HEADER.size:
+                (riff_id, _, wave_id, fmt_id, fmt_size, _, channels, sample_rate,
+                 _, _, _, data_id, data_size) = _CANONICAL_WAV_HEADER.unpack_from(wav_bytes, 0)
+                if (riff_id == b"RIFF" and wave_id == b"WAVE" and fmt_id == b"fmt "
+                        and fmt_size == 16 and data_id == b"data"):
+                    self._wav_format = (wav_bytes[_CANONICAL_WAV_FORMAT], sample_rate, channels)
+                    return self._pcm_view(wav_bytes, _CANONICAL_WAV_HEADER.size, data_size, sample_rate, channels)
+            
+            # Walk the RIFF chunks directly and view the PCM in place, rather
+            # than copying it out through wave.readframes()
+            riff_id, _, wave_id = _RIFF_HEADER.unpack_from(wav_bytes, 0)
+            if riff_id != b"RIFF" or wave_id != b"WAVE":
+                raise ValueError("response is not a RIFF/WAVE file")
+            
+            sample_rate = None
+            channels = 1
+            offset = _RIFF_HEADER.size
+            while offset + _CHUNK_HEADER.size <= len(wav_bytes):
+                chunk_id, chunk_size = _CHUNK_HEADER.unpack_from(wav_bytes, offset)
+                offset += _CHUNK_HEADER.size
                 
-                # Convert to mono if stereo
-                if channels == 2:
-                    audio_array = audio_array.reshape(-1, 2).mean(axis=1).astype(np.int16)
-                    logger.info("🔊 Converted stereo to mono")
+                if chunk_id == b"fmt ":
+                    _, channels, sample_rate = _FMT_FIELDS.unpack_from(wav_bytes, offset)
+                elif chunk_id == b"data":
+                    return self._pcm_view(wav_bytes, offset, chunk_size, sample_rate, channels)
                 
-                return audio_array
+                offset += chunk_size + (chunk_size & 1)
+            
+            raise ValueError("WAV file has no data chunk")
                 
         except Exception as e:
             logger.error(f"❌ WAV conversion failed: {e}")
             return None
     
-    def _audio_to_frames(self, audio_data: np.ndarray, sample_rate: int, frame_size_ms: int = 20) -> list[rtc.AudioFrame]:
-        """Convert audio data to LiveKit AudioFrame chunks"""
+    def _pcm_view(self, wav_bytes: bytes, offset: int, data_size: int, sample_rate: int, channels: int) -> np.ndarray:
+        """View a WAV data chunk as 16-bit PCM, downmixing stereo to mono"""
+        # Convert to numpy array (16-bit PCM)
+        data_size = min(data_size, len(wav_bytes) - offset)
+        audio_array = np.frombuffer(wav_bytes, dtype=np.int16, count=data_size // 2, offset=offset)
+        
+        logger.info(f"📊 WAV format: {len(audio_array) // channels} frames, {sample_rate}Hz, {channels} channels")
+        
+        # Convert to mono if stereo
+        if channels == 2:
+            audio_array = audio_array.reshape(-1, 2).mean(axis=1).astype(np.int16)
+            logger.info("🔊 Converted stereo to mono")
+        
+        return audio_array
+    
+    def _audio_to_frames(self, audio_data: np.ndarray, sample_rate: int, frame_size_ms: int = 20) -> Iterator[rtc.AudioFrame]:
+        """Lazily cut audio data into LiveKit AudioFrame chunks"""
         frame_samples = int(sample_rate * frame_size_ms / 1000)  # 20ms frames
-        frames = []
         
-        for i in range(0, len(audio_data), frame_samples):
-            chunk = audio_data[i:i + frame_samples]
-            
-            # Pad if needed
-            if len(chunk) < frame_samples:
-                chunk = np.pad(chunk, (0, frame_samples - len(chunk)))
-            
-            # Create AudioFrame
-            frame = rtc.AudioFrame(
-                data=chunk.tobytes(),
+        # Walk whole frames as rows of a 2-D view; only the tail needs padding.
+        # Rows are handed to AudioFrame as byte views, so no per-frame tobytes() copy,
+        # and frames are yielded one at a time rather than collected into a list.
+        whole = len(audio_data) - len(audio_data) % frame_samples
+        for chunk in audio_data[:whole].reshape(-1, frame_samples):
+            yield rtc.AudioFrame(
+                data=memoryview(chunk).cast("B"),
                 sample_rate=sample_rate,
                 num_channels=1,
-                samples_per_channel=len(chunk),
+                samples_per_channel=frame_samples,
             )
-            frames.append(frame)
         
-        return frames
+        if whole < len(audio_data):
+            tail = np.zeros(frame_samples, dtype=audio_data.dtype)
+            tail[:len(audio_data) - whole] = audio_data[whole:]
+            yield rtc.AudioFrame(
+                data=memoryview(tail).cast("B"),
+                sample_rate=sample_rate,
+                num_channels=1,
+                samples_per_channel=frame_samples,
+            )
     
     def _create_silence_frame(self, duration_ms: int = 20) -> rtc.AudioFrame:
         """Create a silence audio frame"""
@@ -525,9 +662,7 @@ class CustomTTSAgent(Agent):
                 agent_response=agent_response,
                 technical_metadata={
                     "turn_number": self.conversation_turn,
-                    "character": self.character,
-                    "tts_engine": "kokoro",
-                    "voice": self.selected_voice,
+                    **self._turn_metadata_base,
                     "response_length": len(agent_response),
                     "timestamp": datetime.utcnow().isoformat()
                 }
@@ -538,33 +673,31 @@ class CustomTTSAgent(Agent):
             logger.info(f"   🤖 {self.character.title()}: '{agent_response[:40]}...'")
             
         except Exception as e:
-            logger.error(f"❌ Failed to store conversation: {e}")
-            import traceback
-            logger.error(f"Full error: {traceback.format_exc()}")
+            logger.exception(f"❌ Failed to store conversation: {e}")
 
     async def _broadcast_performance_metrics(self, breakdown):
         """Broadcast real-time performance metrics to dashboard via WebSocket"""
         try:
             # Send HTTP request to trigger WebSocket broadcast
-            async with httpx.AsyncClient() as client:
-                await client.post(
-                    "http://localhost:10000/api/ws/broadcast",
-                    json={
-                        "type": "performance_update",
-                        "session_id": self.current_session_id or "unknown",
-                        "user_id": self.current_user_id or "unknown",
-                        "metadata": {
-                            "timestamp": breakdown.timestamp,
-                            "total_latency": breakdown.total,
-                            "stt_latency": breakdown.stt,
-                            "llm_latency": breakdown.llm,
-                            "tts_latency": breakdown.tts,
-                            "network_latency": breakdown.network,
-                            "character": self.character
-                        }
-                    },
-                    timeout=2.0
-                )
+            await _get_http_client().post(
+                "http://localhost:10000/api/ws/broadcast",
+                content=orjson.dumps({
+                    "type": "performance_update",
+                    "session_id": self.current_session_id or "unknown",
+                    "user_id": self.current_user_id or "unknown",
+                    "metadata": {
+                        "timestamp": breakdown.timestamp,
+                        "total_latency": breakdown.total,
+                        "stt_latency": breakdown.stt,
+                        "llm_latency": breakdown.llm,
+                        "tts_latency": breakdown.tts,
+                        "network_latency": breakdown.network,
+                        "character": self.character
+                    }
+                }),
+                headers=_JSON_HEADERS,
+                timeout=2.0
+            )
             logger.info(f"📡 Broadcasted performance metrics to dashboard")
         except Exception as e:
             logger.warning(f"⚠️ Failed to broadcast to dashboard: {e}")
@@ -603,6 +736,7 @@ async def entrypoint(ctx: JobContext):
     
     # Store character for later use in the agent
     setattr(ctx, 'detected_character', character)
+    ctx.add_shutdown_callback(close_http_client)
     
     logger.info(f"🔗 Connecting to room: {ctx.room.name}")
     await ctx.connect()
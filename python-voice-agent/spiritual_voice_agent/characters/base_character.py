@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator, Dict, List, Optional
+from collections import deque
+from typing import AsyncGenerator, Deque, Dict, Optional
 
 from livekit.agents import Agent
 
@@ -8,9 +9,12 @@ from ..services.llm.base import BaseLLMService
 
 class BaseSpiritualAgent(Agent, ABC):
     def __init__(self, llm_service: BaseLLMService):
-        super().__init__(instructions=self.get_instructions(), tools=self.get_tools())
+        # Instructions are fixed per character, so build them once rather than per turn
+        self._instructions = self.get_instructions()
+        super().__init__(instructions=self._instructions, tools=self.get_tools())
         self.llm_service = llm_service
-        self._conversation_history: List[Dict[str, str]] = []
+        # Last 10 exchanges; the deque drops the oldest messages as new ones arrive
+        self._conversation_history: Deque[Dict[str, str]] = deque(maxlen=20)
 
     @abstractmethod
     def get_instructions(self) -> str:
@@ -48,12 +52,12 @@ class BaseSpiritualAgent(Agent, ABC):
     ) -> str:
         """Generate a response using the LLM service with character context"""
         # Prepare the full prompt with character instructions
-        full_prompt = f"{self.get_instructions()}\n\nUser: {user_input}"
+        full_prompt = f"{self._instructions}\n\nUser: {user_input}"
 
         # Generate response using LLM
         response = await self.llm_service.generate_response(
             prompt=full_prompt,
-            context=self._conversation_history,
+            context=list(self._conversation_history),
             temperature=temperature,
             max_tokens=max_tokens,
         )
@@ -62,17 +66,13 @@ class BaseSpiritualAgent(Agent, ABC):
         self._conversation_history.append({"role": "user", "content": user_input})
         self._conversation_history.append({"role": "assistant", "content": response})
 
-        # Keep conversation history manageable (last 10 exchanges)
-        if len(self._conversation_history) > 20:
-            self._conversation_history = self._conversation_history[-20:]
-
         return response
 
     async def generate_streaming_response(
         self, user_input: str, temperature: float = 0.7, max_tokens: Optional[int] = None
     ) -> AsyncGenerator[str, None]:
         """Generate a streaming response using the LLM service"""
-        full_prompt = f"{self.get_instructions()}\n\nUser: {user_input}"
+        full_prompt = f"{self._instructions}\n\nUser: {user_input}"
 
         # Update conversation history with user input
         self._conversation_history.append({"role": "user", "content": user_input})
@@ -81,7 +81,7 @@ class BaseSpiritualAgent(Agent, ABC):
         response_chunks = []
         async for chunk in self.llm_service.generate_stream(
             prompt=full_prompt,
-            context=self._conversation_history,
+            context=list(self._conversation_history),
             temperature=temperature,
             max_tokens=max_tokens,
         ):
@@ -91,7 +91,3 @@ class BaseSpiritualAgent(Agent, ABC):
         # Update conversation history with complete response
         complete_response = "".join(response_chunks)
         self._conversation_history.append({"role": "assistant", "content": complete_response})
-
-        # Keep conversation history manageable
-        if len(self._conversation_history) > 20:
-            self._conversation_history = self._conversation_history[-20:]
@@ -4,8 +4,9 @@ from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import List
 
+import orjson
 from dotenv import find_dotenv, load_dotenv
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 load_dotenv(find_dotenv())
@@ -57,6 +58,7 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("👋 Spiritual Guidance API shutting down")
+    await voice_config.close_kokoro_client()
     
 
 
@@ -104,30 +106,35 @@ async def health_check():
     }
 
 
+# Root endpoint payload is static - serialize it once at import
+_ROOT_RESPONSE_BYTES = orjson.dumps({
+    "message": "Spiritual Guidance Voice Agent API",
+    "version": "1.0.0",
+    "status": "healthy",
+    "characters": ["adina", "raffa"],
+    "endpoints": {
+        "health": "/health",
+        "websocket": "/ws/audio",
+        "token": "/api/spiritual-token",
+        "legacy_token": "/api/createToken",
+        "metrics": "/metrics",
+        "cost": "/cost",
+        "voice_current": "/api/voice/current",
+        "voice_switch": "/api/voice/switch",
+        "voice_characters": "/api/voice/characters",
+        "voice_test": "/api/voice/test/{character}",
+    },
+    "docs": "/docs",
+})
+
+
 # Root endpoint - supports both GET and HEAD
 @app.get("/")
 @app.head("/")
 async def root():
     """Root endpoint with API information"""
-    return {
-        "message": "Spiritual Guidance Voice Agent API",
-        "version": "1.0.0",
-        "status": "healthy",
-        "characters": ["adina", "raffa"],
-        "endpoints": {
-            "health": "/health",
-            "websocket": "/ws/audio",
-            "token": "/api/spiritual-token",
-            "legacy_token": "/api/createToken",
-            "metrics": "/metrics",
-            "cost": "/cost",
-            "voice_current": "/api/voice/current",
-            "voice_switch": "/api/voice/switch",
-            "voice_characters": "/api/voice/characters",
-            "voice_test": "/api/voice/test/{character}",
-        },
-        "docs": "/docs",
-    }
+    # A fresh Response per request: middleware appends headers to the instance
+    return Response(_ROOT_RESPONSE_BYTES, media_type="application/json")
 
 
 # Include routers (excluding broken websocket_audio)
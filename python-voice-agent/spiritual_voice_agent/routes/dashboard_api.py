@@ -257,7 +257,7 @@ async def get_dashboard_overview():
         system_health = await health_monitor.get_full_system_status()
         
         # Calculate key metrics
-        healthy_services = len([s for s in system_health.services if s.status == "healthy"])
+        healthy_services = sum(1 for s in system_health.services if s.status == "healthy")
         total_services = len(system_health.services)
         
         return {
@@ -3,16 +3,41 @@ Voice Configuration API Routes
 Handles voice switching and character management for production backend
 """
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, Dict, Any
-import json
+import asyncio
+import hashlib
 import os
 import logging
+import tempfile
+import time
 from pathlib import Path
+from functools import lru_cache
+from types import MappingProxyType
+
+import httpx
+import orjson
 
 router = APIRouter(prefix="/api/voice", tags=["voice"])
 
+# Persisted config location, resolved once instead of on every request
+_CONFIG_DIR = Path("./config").resolve()
+_CONFIG_FILE = (_CONFIG_DIR / "current_voice_config.json").resolve()
+# is_relative_to compares path components, so "config_backup/..." can't pass as "config/..."
+_CONFIG_FILE_VALID = _CONFIG_FILE.is_relative_to(_CONFIG_DIR)
+
+try:
+    _CONFIG_DIR.mkdir(exist_ok=True, mode=0o755)
+except OSError as e:
+    logging.warning(f"Could not create voice config directory {_CONFIG_DIR}: {e}")
+
+# The config file is the state shared between workers; re-stat it at most
+# once per TTL window. [checked_at (monotonic), last seen st_mtime_ns]
+_CONFIG_SYNC_TTL = 0.5
+_CONFIG_SYNC = [float("-inf"), None]
+
 # In-memory voice configuration (could be moved to database in production)
 current_voice_config = {
     "character": "adina",
@@ -21,15 +46,19 @@ current_voice_config = {
 }
 
 class VoiceConfig(BaseModel):
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     character: str
     voice: Optional[str] = None
     description: Optional[str] = None
 
 class VoiceUpdateRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     character: str  # "adina" or "raffa"
 
 # Available voice configurations
-VOICE_CONFIGURATIONS = {
+_VOICE_CONFIGURATION_DATA = {
     "adina": {
         "character": "adina",
         "voice": "af_heart",
@@ -44,137 +73,248 @@ VOICE_CONFIGURATIONS = {
     }
 }
 
+# Read-only views: entries are shared reference data and are only copied
+# when they become the mutable current_voice_config
+VOICE_CONFIGURATIONS = {
+    name: MappingProxyType(config) for name, config in _VOICE_CONFIGURATION_DATA.items()
+}
+
+# VOICE_CONFIGURATIONS never changes at runtime - derive static payloads once
+_AVAILABLE_VOICE_KEYS = tuple(VOICE_CONFIGURATIONS.keys())
+_VALID_CHARACTERS = frozenset(_AVAILABLE_VOICE_KEYS)
+_CHARACTERS_RESPONSE_BYTES = orjson.dumps({
+    "status": "success",
+    "characters": _VOICE_CONFIGURATION_DATA
+})
+
+def _make_etag(body: bytes) -> str:
+    """Strong ETag for a response body"""
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check the request's If-None-Match header against an ETag"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))
+
+_CHARACTERS_ETAG = _make_etag(_CHARACTERS_RESPONSE_BYTES)
+
+# /current body + ETag, rebuilt only when current_voice_config changes:
+# [config snapshot, body, etag]
+_CURRENT_VOICE_CACHE = [None, b"", ""]
+
+# Shared Kokoro client so voice tests reuse pooled keep-alive connections
+_KOKORO_BASE_URL = "http://localhost:8001"
+_kokoro_client = None
+
+def _get_kokoro_client():
+    """Get or create the shared Kokoro HTTP client"""
+    global _kokoro_client
+    if _kokoro_client is None:
+        _kokoro_client = httpx.AsyncClient(
+            base_url=_KOKORO_BASE_URL,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            timeout=10.0,
+        )
+    return _kokoro_client
+
+async def close_kokoro_client():
+    """Close the shared Kokoro HTTP client on shutdown"""
+    global _kokoro_client
+    if _kokoro_client is not None:
+        await _kokoro_client.aclose()
+        _kokoro_client = None
+
 @router.get("/current")
-async def get_current_voice():
+async def get_current_voice(request: Request):
     """Get current voice configuration"""
-    return {
-        "status": "success",
-        "current_voice": current_voice_config,
-        "available_voices": list(VOICE_CONFIGURATIONS.keys())
-    }
+    _sync_voice_config_from_file()
+    
+    if _CURRENT_VOICE_CACHE[0] != current_voice_config:
+        body = orjson.dumps({
+            "status": "success",
+            "current_voice": current_voice_config,
+            "available_voices": _AVAILABLE_VOICE_KEYS
+        })
+        _CURRENT_VOICE_CACHE[:] = [dict(current_voice_config), body, _make_etag(body)]
+    
+    _, body, etag = _CURRENT_VOICE_CACHE
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
 
 @router.post("/switch")
 async def switch_voice(request: VoiceUpdateRequest):
     """Switch voice character for the agent"""
     global current_voice_config
     
-    character = request.character.lower()
+    character = request.character.casefold()
     
-    if character not in VOICE_CONFIGURATIONS:
+    if character not in _VALID_CHARACTERS:
         raise HTTPException(
             status_code=400,
-            detail=f"Unknown character '{character}'. Available: {list(VOICE_CONFIGURATIONS.keys())}"
+            detail=_unknown_character_detail(character)
         )
     
-    # Update current configuration
-    current_voice_config = VOICE_CONFIGURATIONS[character].copy()
+    # Nothing to persist if the requested voice is already active
+    _sync_voice_config_from_file(force=True)
+    if current_voice_config == VOICE_CONFIGURATIONS[character]:
+        return ORJSONResponse({
+            "status": "success",
+            "message": f"Voice switched to {character}",
+            "new_voice": current_voice_config
+        })
     
-    # Save to file for agent persistence - with security validation
-    config_dir = Path("./config")
-    config_dir.mkdir(exist_ok=True, mode=0o755)
-    config_file = config_dir / "current_voice_config.json"
+    # Update current configuration
+    current_voice_config = dict(VOICE_CONFIGURATIONS[character])
     
-    # Validate config_file is within allowed directory
-    if not str(config_file.resolve()).startswith(str(config_dir.resolve())):
+    # Save to file for agent persistence - validate config_file is within allowed directory
+    if not _CONFIG_FILE_VALID:
         raise ValueError("Invalid file path")
     
     try:
-        with open(config_file, "w") as f:
-            json.dump(current_voice_config, f, indent=2)
+        payload = orjson.dumps(current_voice_config, option=orjson.OPT_INDENT_2)
+        loop = asyncio.get_running_loop()
+        mtime = await loop.run_in_executor(None, _write_config_atomic, _CONFIG_FILE, payload)
+        # Record our own write on the event loop, so the next sync doesn't reload it
+        _CONFIG_SYNC[1] = mtime
     except Exception as e:
         logging.error(f"Failed to save voice config: {e}")
         raise HTTPException(status_code=500, detail="Failed to save configuration")
     
-    return {
+    return ORJSONResponse({
         "status": "success",
         "message": f"Voice switched to {character}",
         "new_voice": current_voice_config
-    }
+    })
 
 @router.get("/characters")
-async def list_characters():
+async def list_characters(request: Request):
     """List all available voice characters"""
-    return {
-        "status": "success",
-        "characters": VOICE_CONFIGURATIONS
-    }
+    if _etag_matches(request, _CHARACTERS_ETAG):
+        return Response(status_code=304, headers={"ETag": _CHARACTERS_ETAG})
+    return Response(
+        _CHARACTERS_RESPONSE_BYTES,
+        media_type="application/json",
+        headers={"ETag": _CHARACTERS_ETAG}
+    )
 
 @router.get("/test/{character}")
 async def test_voice(character: str):
     """Test a specific voice by making a Kokoro API call"""
-    character = character.lower()
+    character = character.casefold()
     
-    if character not in VOICE_CONFIGURATIONS:
+    if character not in _VALID_CHARACTERS:
         raise HTTPException(
             status_code=400,
             detail=f"Unknown character '{character}'"
         )
     
     try:
-        import httpx
-        
         # Test the voice with a short phrase
         test_text = f"Hello, this is {character} speaking. Voice test successful."
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "http://localhost:8001/synthesize",
-                data={
-                    "text": test_text,
-                    "voice": character
-                },
-                timeout=10.0
-            )
-            
-            if response.status_code == 200:
-                return {
-                    "status": "success",
-                    "message": f"Voice test successful for {character}",
-                    "character": VOICE_CONFIGURATIONS[character],
-                    "audio_generated": len(response.content)
-                }
-            else:
+        # Only the audio size is reported, so count bytes instead of buffering the WAV
+        async with _get_kokoro_client().stream(
+            "POST",
+            "/synthesize",
+            data={
+                "text": test_text,
+                "voice": character
+            }
+        ) as response:
+            if response.status_code != 200:
+                await response.aread()
                 raise HTTPException(
                     status_code=500,
                     detail=f"Voice test failed: {response.status_code} - {response.text}"
                 )
-                
+            
+            audio_generated = 0
+            async for chunk in response.aiter_bytes(65536):
+                audio_generated += len(chunk)
+        
+        return ORJSONResponse({
+            "status": "success",
+            "message": f"Voice test successful for {character}",
+            "character": _VOICE_CONFIGURATION_DATA[character],
+            "audio_generated": audio_generated
+        })
+            
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Voice test error: {str(e)}"
         )
 
+@lru_cache(maxsize=64)
+def _unknown_character_detail(character: str) -> str:
+    """Error detail for an unknown character, cached for repeated bad requests"""
+    return f"Unknown character '{character}'. Available: {list(_AVAILABLE_VOICE_KEYS)}"
+
+def _write_config_atomic(config_file: Path, payload: bytes) -> int:
+    """Write the config to a temp file, rename it over the target and return its st_mtime_ns"""
+    # A unique temp file per writer, so concurrent switches from other workers
+    # can't truncate or rename each other's half-written file
+    fd, tmp_name = tempfile.mkstemp(
+        dir=config_file.parent, prefix=config_file.name + ".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            os.fchmod(f.fileno(), 0o644)  # mkstemp creates 0600; keep the file readable as before
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, config_file)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    return config_file.stat().st_mtime_ns
+
+def _sync_voice_config_from_file(force: bool = False) -> None:
+    """Pick up voice switches persisted by other worker processes"""
+    now = time.monotonic()
+    if not force and now - _CONFIG_SYNC[0] < _CONFIG_SYNC_TTL:
+        return
+    _CONFIG_SYNC[0] = now
+    
+    try:
+        mtime = _CONFIG_FILE.stat().st_mtime_ns
+    except OSError:
+        return
+    
+    if mtime != _CONFIG_SYNC[1]:
+        _CONFIG_SYNC[1] = mtime
+        load_voice_config_from_file()
+
 def get_current_voice_config() -> Dict[str, Any]:
     """Get current voice configuration for use by other modules"""
+    _sync_voice_config_from_file()
     return current_voice_config.copy()
 
 def load_voice_config_from_file() -> Dict[str, Any]:
     """Load voice configuration from file if it exists"""
     global current_voice_config
     
-    # Use secure file path validation
-    config_dir = Path("./config")
-    config_file = config_dir / "current_voice_config.json"
-    
     # Validate config_file is within allowed directory
-    try:
-        if not str(config_file.resolve()).startswith(str(config_dir.resolve())):
-            logging.warning("Invalid config file path detected")
-            return current_voice_config.copy()
-    except Exception:
-        # If path validation fails, don't load from file
+    if not _CONFIG_FILE_VALID:
+        logging.warning("Invalid config file path detected")
         return current_voice_config.copy()
     
-    if config_file.exists():
+    if _CONFIG_FILE.exists():
         try:
-            with open(config_file, "r") as f:
-                loaded_config = json.load(f)
-                current_voice_config.update(loaded_config)
+            with open(_CONFIG_FILE, "rb") as f:
+                data = f.read()
+            loaded_config = orjson.loads(data)
+            current_voice_config.update(loaded_config)
         except Exception as e:
             logging.warning(f"Could not load voice config from file: {e}")
     
     return current_voice_config.copy()
 
 # Initialize voice config on module load
-load_voice_config_from_file()
\ No newline at end of file
+_sync_voice_config_from_file(force=True)
\ No newline at end of file
@@ -9,8 +9,10 @@ and decision metrics for scaling (GPU upgrades, server capacity).
 import asyncio
 import json
 import logging
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 import statistics
 
@@ -53,7 +55,8 @@ class ConcurrentUserAnalytics:
     
     def __init__(self, supabase_client=None):
         self.supabase = supabase_client
-        self.metrics_history: List[ConcurrentUserMetrics] = []
+        # Appended in time order, so expiry only ever pops from the left
+        self.metrics_history: Deque[ConcurrentUserMetrics] = deque()
         self.usage_patterns: Dict[int, UsagePattern] = {}
         
     async def get_current_concurrent_users(self) -> ConcurrentUserMetrics:
@@ -153,7 +156,9 @@ class ConcurrentUserAnalytics:
             
             # Keep only last 24 hours of metrics
             cutoff = now - timedelta(hours=24)
-            self.metrics_history = [m for m in self.metrics_history if m.timestamp > cutoff]
+            history = self.metrics_history
+            while history and history[0].timestamp <= cutoff:
+                history.popleft()
             
             return metrics
             
@@ -172,6 +177,12 @@ class ConcurrentUserAnalytics:
                 server_load_percentage=0
             )
     
+    def _recent_metrics(self, count: int) -> List[ConcurrentUserMetrics]:
+        """Return the newest ``count`` metrics, oldest first."""
+        recent = list(islice(reversed(self.metrics_history), count))
+        recent.reverse()
+        return recent
+    
     async def _execute_query(self, query: str) -> List[Dict]:
         """Execute REAL database query using Supabase client."""
         if not self.supabase:
@@ -199,8 +210,8 @@ class ConcurrentUserAnalytics:
                 
                 recent_sessions = self.supabase.table('conversation_sessions').select('session_start, session_end').gte('session_start', twenty_four_hours_ago).execute()
                 
-                sessions_started = len([s for s in recent_sessions.data if s['session_start'] >= one_hour_ago])
-                sessions_ended = len([s for s in recent_sessions.data if s.get('session_end') and s['session_end'] >= one_hour_ago])
+                sessions_started = sum(1 for s in recent_sessions.data if s['session_start'] >= one_hour_ago)
+                sessions_ended = sum(1 for s in recent_sessions.data if s.get('session_end') and s['session_end'] >= one_hour_ago)
                 
                 # Calculate real average duration
                 durations = []
@@ -267,7 +278,7 @@ class ConcurrentUserAnalytics:
         if not self.metrics_history:
             return {"recommendation": "insufficient_data", "reason": "Need more usage data"}
         
-        recent_metrics = self.metrics_history[-10:]  # Last 10 data points
+        recent_metrics = self._recent_metrics(10)  # Last 10 data points
         
         # Calculate key metrics
         avg_concurrent = statistics.mean(m.active_users for m in recent_metrics)
@@ -365,7 +376,7 @@ class ConcurrentUserAnalytics:
         
         # Prepare time series data for charts
         time_series = []
-        for metric in self.metrics_history[-24:]:  # Last 24 hours
+        for metric in self._recent_metrics(24):  # Last 24 hours
             time_series.append({
                 "timestamp": metric.timestamp.isoformat(),
                 "active_users": metric.active_users,
@@ -8,8 +8,10 @@ and provides cost projections for business intelligence.
 
 import asyncio
 import logging
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Deque, Dict, List, Optional
 from dataclasses import dataclass, asdict
 import statistics
 
@@ -51,7 +53,8 @@ class CostTracker:
     """
     
     def __init__(self):
-        self.cost_history: List[CostBreakdown] = []
+        # Last 30 days; the oldest day falls off in O(1) as a new one is added
+        self.cost_history: Deque[CostBreakdown] = deque(maxlen=30)
         self.current_day_costs = {
             "deepgram": 0.0,
             "openai": 0.0,
@@ -124,7 +127,10 @@ class CostTracker:
     
     async def get_cost_breakdown_history(self, days: int = 30) -> List[CostBreakdown]:
         """Get historical cost breakdown."""
-        return self.cost_history[-days:]
+        history = self.cost_history
+        # Same start as the list slice history[-days:] (days=0 returns everything)
+        start = slice(-days, None).indices(len(history))[0]
+        return list(islice(history, start, None))
     
     async def add_daily_breakdown(self) -> CostBreakdown:
         """Add current day to cost history and reset daily counters."""
@@ -147,12 +153,9 @@ class CostTracker:
             cost_per_conversation=total_cost / conversations if conversations > 0 else 0
         )
         
+        # Add to history (deque keeps only the last 30 days)
         self.cost_history.append(breakdown)
         
-        # Keep only last 30 days
-        if len(self.cost_history) > 30:
-            self.cost_history = self.cost_history[-30:]
-        
         # Reset daily counters
         self.current_day_costs = {
             "deepgram": 0.0,
@@ -9,9 +9,11 @@ for the voice AI dashboard health monitoring component.
 import asyncio
 import aiohttp
 import logging
+import os
 import time
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Deque, Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 import psutil
 
@@ -70,7 +72,11 @@ class SystemHealthMonitor:
             }
         }
         
-        self.health_history: Dict[str, List[ServiceHealth]] = {}
+        # LiveKit credentials come from the process environment, so whether
+        # they are configured is decided once rather than on every check
+        self._livekit_configured = bool(os.getenv("LIVEKIT_URL") and os.getenv("LIVEKIT_API_KEY"))
+        
+        self.health_history: Dict[str, Deque[ServiceHealth]] = {}
         self.uptime_tracking: Dict[str, Dict] = {}
         
         # Initialize uptime tracking
@@ -85,6 +91,8 @@ class SystemHealthMonitor:
     async def check_service_health(self, service_name: str, config: Dict) -> ServiceHealth:
         """Check health of a single service."""
         start_time = time.time()
+        # Counters for this service, looked up once for every update below
+        tracking = self.uptime_tracking[service_name]
         
         try:
             if service_name == "LiveKit Connection":
@@ -95,14 +103,13 @@ class SystemHealthMonitor:
                 status, response_time = await self._check_http_health(config["url"])
             
             # Update uptime tracking
-            self.uptime_tracking[service_name]["total_checks"] += 1
+            tracking["total_checks"] += 1
             if status == "healthy":
-                self.uptime_tracking[service_name]["successful_checks"] += 1
+                tracking["successful_checks"] += 1
             else:
-                self.uptime_tracking[service_name]["last_failure"] = time.time()
+                tracking["last_failure"] = time.time()
             
             # Calculate uptime percentage
-            tracking = self.uptime_tracking[service_name]
             uptime_percentage = (tracking["successful_checks"] / tracking["total_checks"]) * 100
             
             service_health = ServiceHealth(
@@ -115,26 +122,21 @@ class SystemHealthMonitor:
                 error_message=""
             )
             
-            # Add to history
+            # Add to history (keep only last 100 checks per service)
             if service_name not in self.health_history:
-                self.health_history[service_name] = []
+                self.health_history[service_name] = deque(maxlen=100)
             
             self.health_history[service_name].append(service_health)
             
-            # Keep only last 100 checks per service
-            if len(self.health_history[service_name]) > 100:
-                self.health_history[service_name] = self.health_history[service_name][-100:]
-            
             return service_health
             
         except Exception as e:
             logger.error(f"❌ Error checking {service_name} health: {e}")
             
             # Record failed check
-            self.uptime_tracking[service_name]["total_checks"] += 1
-            self.uptime_tracking[service_name]["last_failure"] = time.time()
+            tracking["total_checks"] += 1
+            tracking["last_failure"] = time.time()
             
-            tracking = self.uptime_tracking[service_name]
             uptime_percentage = (tracking["successful_checks"] / tracking["total_checks"]) * 100
             
             return ServiceHealth(
@@ -180,25 +182,17 @@ class SystemHealthMonitor:
         
         try:
             # Check if LiveKit environment variables are set
-            import os
-            livekit_url = os.getenv("LIVEKIT_URL")
-            livekit_key = os.getenv("LIVEKIT_API_KEY")
-            
-            if not livekit_url or not livekit_key:
+            if not self._livekit_configured:
                 return "warning", 50  # Missing config but not critical
             
             # Simple connectivity check - for now just check if variables exist
             # In production, you'd want to actually test the connection
             response_time = (time.time() - start_time) * 1000
             
-            # Check if agent process is running
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                try:
-                    cmdline = ' '.join(proc.info['cmdline'] or [])
-                    if 'simple_working_agent' in cmdline and 'main.py' in cmdline:
-                        return "healthy", response_time
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+            # Check if agent process is running (walks the whole process
+            # table, so keep it off the event loop)
+            if await asyncio.to_thread(self._agent_process_running):
+                return "healthy", response_time
             
             # Agent not running
             return "warning", response_time
@@ -207,11 +201,23 @@ class SystemHealthMonitor:
             response_time = (time.time() - start_time) * 1000
             return "critical", response_time
     
+    @staticmethod
+    def _agent_process_running() -> bool:
+        """Scan the process table for the voice agent worker (blocking)."""
+        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+            try:
+                cmdline = ' '.join(proc.info['cmdline'] or [])
+                if 'simple_working_agent' in cmdline and 'main.py' in cmdline:
+                    return True
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return False
+    
     async def get_system_metrics(self) -> Dict[str, float]:
         """Get system resource metrics."""
         try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            # CPU usage (samples for 100ms, so keep it off the event loop)
+            cpu_percent = await asyncio.to_thread(psutil.cpu_percent, interval=0.1)
             
             # Memory usage
             memory = psutil.virtual_memory()
@@ -247,11 +253,12 @@ class SystemHealthMonitor:
     async def get_full_system_status(self) -> SystemStatus:
         """Get complete system health status."""
         
-        # Check all services
-        service_healths = []
-        for service_name, config in self.services.items():
-            health = await self.check_service_health(service_name, config)
-            service_healths.append(health)
+        # Check all services concurrently so one slow endpoint (up to its 5s
+        # timeout) doesn't hold up the others; results keep the service order
+        service_healths = await asyncio.gather(*(
+            self.check_service_health(service_name, config)
+            for service_name, config in self.services.items()
+        ))
         
         # Get system metrics
         system_metrics = await self.get_system_metrics()
@@ -288,7 +295,7 @@ class SystemHealthMonitor:
             return {"error": f"No recent history for {service_name}"}
         
         # Calculate statistics
-        healthy_checks = len([h for h in recent_history if h.status == "healthy"])
+        healthy_checks = sum(1 for h in recent_history if h.status == "healthy")
         total_checks = len(recent_history)
         uptime_percentage = (healthy_checks / total_checks) * 100
         
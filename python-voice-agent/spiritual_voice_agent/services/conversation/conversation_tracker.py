@@ -10,13 +10,20 @@ from typing import Dict, Any, Optional
 from datetime import datetime
 import uuid
 import httpx
+import orjson
 
 from .models import ConversationSession, ConversationTurn
 from .event_processor import ConversationEventProcessor
+from .supabase_integration import get_supabase_conversation_service
 from .voice_usage_tracker import get_voice_usage_tracker
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+# Dashboard broadcasts are live updates: while the API server is slow or down,
+# keep at most this many pending and drop new ones rather than grow a stale backlog
+_BROADCAST_QUEUE_SIZE = 100
+
 
 class ConversationTracker:
     """
@@ -37,6 +44,10 @@ class ConversationTracker:
         self.event_queue = asyncio.Queue()
         self.processing_task = None
         
+        # Dashboard broadcasts go through one long-lived sender in queue order
+        self._broadcast_queue = asyncio.Queue(maxsize=_BROADCAST_QUEUE_SIZE)
+        self._broadcast_task = None
+        
         logger.info("🎓 Conversation Tracker initialized for LLM training data collection")
         logger.info("⏱️ Voice usage tracking integrated for billing analytics")
     
@@ -52,15 +63,30 @@ class ConversationTracker:
             session_id: Unique session identifier
         """
         session_id = str(uuid.uuid4())
+        # One clock read for both the session record and its start event
+        session_start = datetime.utcnow()
         
         session = ConversationSession(
             id=session_id,
             user_id=user_id,
-            session_start=datetime.utcnow(),
+            session_start=session_start,
             session_metadata=session_metadata or {}
         )
         
         self.active_sessions[session_id] = session
+        metadata = session_metadata or {}
+        
+        # 🔌 REAL-TIME: Hand the WebSocket broadcast to the background sender
+        self._queue_broadcast({
+            "type": "conversation_start",
+            "session_id": session_id,
+            "user_id": user_id,
+            "metadata": {
+                "character": metadata.get("character", "unknown"),
+                "session_type": metadata.get("session_type", "voice_chat"),
+                "room_name": metadata.get("room_name", "unknown")
+            }
+        })
         
         # Start voice usage tracking
         await self.voice_usage_tracker.start_session_tracking(session_id, user_id)
@@ -70,31 +96,10 @@ class ConversationTracker:
             "type": "session_start",
             "session_id": session_id,
             "user_id": user_id,
-            "timestamp": datetime.utcnow(),
+            "timestamp": session_start,
             "metadata": session_metadata
         })
         
-        # 🔌 REAL-TIME: Send HTTP request to API server for WebSocket broadcast
-        try:
-            async with httpx.AsyncClient() as client:
-                await client.post(
-                    "http://localhost:10000/api/ws/broadcast",
-                    json={
-                        "type": "conversation_start",
-                        "session_id": session_id,
-                        "user_id": user_id,
-                        "metadata": {
-                            "character": session_metadata.get("character", "unknown"),
-                            "session_type": session_metadata.get("session_type", "voice_chat"),
-                            "room_name": session_metadata.get("room_name", "unknown")
-                        }
-                    },
-                    timeout=1.0  # Fast timeout to avoid blocking voice
-                )
-            logger.debug(f"📡 HTTP→WebSocket: Broadcasted session start {session_id[:8]}...")
-        except Exception as e:
-            logger.warning(f"⚠️ HTTP→WebSocket broadcast failed (session start): {e}")
-        
         logger.info(f"🎯 Started conversation session {session_id[:8]}... for user {user_id[:8]}...")
         logger.info(f"⏱️ Voice usage tracking started for billing analytics")
         
@@ -127,6 +132,22 @@ class ConversationTracker:
         
         turn_number = session.total_turns + 1
         
+        # 🔌 REAL-TIME: Hand the WebSocket broadcast to the background sender
+        self._queue_broadcast({
+            "type": "conversation_turn",
+            "session_id": session_id,
+            "user_id": user_id,
+            "turn_data": {
+                "turn_number": turn_number,
+                "user_input": user_input[:100] + "..." if len(user_input) > 100 else user_input,
+                "agent_response": agent_response[:100] + "..." if len(agent_response) > 100 else agent_response,
+                "input_length": len(user_input),
+                "response_length": len(agent_response),
+                "character": session.session_metadata.get("character", "unknown"),
+                "technical_metadata": technical_metadata or {}
+            }
+        })
+        
         # Queue event for async processing (ZERO voice impact)
         await self.event_queue.put({
             "type": "conversation_turn",
@@ -142,32 +163,36 @@ class ConversationTracker:
         # Update session turn count immediately (in memory)
         session.total_turns = turn_number
         
-        # 🔌 REAL-TIME: Send HTTP request to API server for WebSocket broadcast
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"🎤 Queued conversation turn {turn_number} for session {session_id[:8]}...")
+    
+    def _queue_broadcast(self, payload: Dict[str, Any]):
+        """Queue a conversation event for the dashboard, starting the sender if needed"""
         try:
-            async with httpx.AsyncClient() as client:
-                await client.post(
-                    "http://localhost:10000/api/ws/broadcast",
-                    json={
-                        "type": "conversation_turn",
-                        "session_id": session_id,
-                        "user_id": user_id,
-                        "turn_data": {
-                            "turn_number": turn_number,
-                            "user_input": user_input[:100] + "..." if len(user_input) > 100 else user_input,
-                            "agent_response": agent_response[:100] + "..." if len(agent_response) > 100 else agent_response,
-                            "input_length": len(user_input),
-                            "response_length": len(agent_response),
-                            "character": session.session_metadata.get("character", "unknown"),
-                            "technical_metadata": technical_metadata or {}
-                        }
-                    },
-                    timeout=1.0  # Fast timeout to avoid blocking voice
-                )
-            logger.debug(f"📡 HTTP→WebSocket: Broadcasted turn {turn_number} for session {session_id[:8]}...")
-        except Exception as e:
-            logger.warning(f"⚠️ HTTP→WebSocket broadcast failed (conversation turn): {e}")
-        
-        logger.debug(f"🎤 Queued conversation turn {turn_number} for session {session_id[:8]}...")
+            self._broadcast_queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            # Dashboard isn't keeping up - drop the event, it would be stale by the time it's sent
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"📡 Broadcast queue full, dropped {payload['type']} for session {payload['session_id'][:8]}...")
+        if self._broadcast_task is None or self._broadcast_task.done():
+            self._broadcast_task = asyncio.create_task(self._broadcast_worker())
+    
+    async def _broadcast_worker(self):
+        """Ask the API server to broadcast queued conversation events to dashboard WebSockets"""
+        async with httpx.AsyncClient() as client:
+            while True:
+                payload = await self._broadcast_queue.get()
+                try:
+                    await client.post(
+                        "http://localhost:10000/api/ws/broadcast",
+                        content=orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS),
+                        headers=_JSON_HEADERS,
+                        timeout=1.0  # Fast timeout so a slow API server doesn't back up the queue
+                    )
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"📡 HTTP→WebSocket: Broadcasted {payload['type']} for session {payload['session_id'][:8]}...")
+                except Exception as e:
+                    logger.warning(f"⚠️ HTTP→WebSocket broadcast failed ({payload['type']}): {e}")
     
     async def end_session(self, session_id: str):
         """End a conversation session"""
@@ -187,7 +212,7 @@ class ConversationTracker:
                 "type": "session_end",
                 "session_id": session_id,
                 "user_id": session.user_id,
-                "timestamp": datetime.utcnow(),
+                "timestamp": session.session_end,
                 "session_summary": session.get_session_summary(),
                 "voice_duration_seconds": duration_seconds
             })
@@ -225,12 +250,13 @@ class ConversationTracker:
     
     async def stop_processing(self):
         """Stop the async event processing loop"""
-        if self.processing_task and not self.processing_task.done():
-            self.processing_task.cancel()
-            try:
-                await self.processing_task
-            except asyncio.CancelledError:
-                pass
+        for task in (self.processing_task, self._broadcast_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
         
         logger.info("⏹️ Stopped conversation event processing")
     
@@ -287,7 +313,8 @@ class ConversationTracker:
             if session:
                 session.add_turn(turn)
             
-            logger.debug(f"✅ Processed and stored conversation turn {event['turn_number']}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"✅ Processed and stored conversation turn {event['turn_number']}")
             
         except Exception as e:
             logger.error(f"❌ Failed to process conversation turn: {e}", exc_info=True)
@@ -312,20 +339,17 @@ class ConversationTracker:
     
     async def _store_conversation_turn(self, turn: ConversationTurn):
         """Store conversation turn in Supabase - REAL IMPLEMENTATION"""
-        from .supabase_integration import get_supabase_conversation_service
-        
         supabase_service = get_supabase_conversation_service()
         success = await supabase_service.store_conversation_turn(turn)
         
         if success:
-            logger.debug(f"✅ STORED turn in Supabase: session={turn.session_id[:8]}..., turn={turn.turn_number}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"✅ STORED turn in Supabase: session={turn.session_id[:8]}..., turn={turn.turn_number}")
         else:
             logger.error(f"❌ Failed to store turn in Supabase: session={turn.session_id[:8]}..., turn={turn.turn_number}")
     
     async def _store_session_start(self, event: Dict[str, Any]):
         """Store session start in Supabase - REAL IMPLEMENTATION"""
-        from .supabase_integration import get_supabase_conversation_service
-        
         # Create session object for storage
         session = ConversationSession(
             id=event["session_id"],
@@ -344,8 +368,6 @@ class ConversationTracker:
     
     async def _store_session_end(self, event: Dict[str, Any]):
         """Store session end in Supabase - REAL IMPLEMENTATION"""
-        from .supabase_integration import get_supabase_conversation_service
-        
         # Update the session with end data
         supabase_service = get_supabase_conversation_service()
         
@@ -13,6 +13,12 @@ from .models import ConversationTurn, SpiritualContext, TechnicalMetadata
 
 logger = logging.getLogger(__name__)
 
+# Simple pattern for common bible books, compiled once for every turn processed
+_BIBLE_REFERENCE_RE = re.compile(
+    r'(Matthew|Mark|Luke|John|Acts|Romans|Corinthians|Galatians|Ephesians|Philippians|Colossians|Thessalonians|Timothy|Titus|Philemon|Hebrews|James|Peter|Jude|Revelation|Psalms|Proverbs|Genesis|Exodus|Leviticus|Numbers|Deuteronomy)\s+\d+[:\d-]*',
+    re.IGNORECASE,
+)
+
 
 class ConversationEventProcessor:
     """
@@ -64,10 +70,11 @@ class ConversationEventProcessor:
         
         This runs asynchronously to avoid impacting voice performance
         """
-        logger.debug(f"Processing conversation turn {turn_number} for session {session_id[:8]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Processing conversation turn {turn_number} for session {session_id[:8]}...")
         
-        # Extract spiritual context
-        spiritual_context = await self._extract_spiritual_context(user_input, agent_response)
+        # Extract spiritual context (plain keyword matching, no I/O to await)
+        spiritual_context = self._extract_spiritual_context(user_input, agent_response)
         
         # Process technical metadata
         tech_metadata = self._process_technical_metadata(technical_metadata or {})
@@ -88,26 +95,32 @@ class ConversationEventProcessor:
         
         return turn
     
-    async def _extract_spiritual_context(self, user_input: str, agent_response: str) -> SpiritualContext:
+    def _extract_spiritual_context(self, user_input: str, agent_response: str) -> SpiritualContext:
         """Extract spiritual context from conversation content"""
         
-        # Combine input and response for analysis
-        combined_text = f"{user_input} {agent_response}".lower()
+        # Lowercase each side once and combine them for analysis
+        user_lower = user_input.lower()
+        response_lower = agent_response.lower()
+        combined_text = f"{user_lower} {response_lower}"
+        
+        # Score every spiritual topic in one pass; the primary topic and the
+        # themes both come from these scores
+        topic_scores = self._score_spiritual_topics(combined_text)
         
         # Detect spiritual topic
-        topic = await self._detect_spiritual_topic(combined_text)
+        topic = max(topic_scores, key=topic_scores.get) if topic_scores else None
         
         # Detect emotional tone
-        emotional_tone = await self._detect_emotional_tone(user_input.lower())
+        emotional_tone = self._detect_emotional_tone(user_lower)
         
         # Detect conversation stage
-        conversation_stage = await self._detect_conversation_stage(user_input.lower(), agent_response.lower())
+        conversation_stage = self._detect_conversation_stage(user_lower, response_lower)
         
         # Extract bible references (simple pattern matching)
-        bible_references = await self._extract_bible_references(agent_response)
+        bible_references = self._extract_bible_references(agent_response)
         
-        # Extract spiritual themes
-        themes = await self._extract_themes(combined_text)
+        # Extract spiritual themes (every topic with at least one keyword match)
+        themes = list(topic_scores)
         
         return SpiritualContext(
             topic=topic,
@@ -117,8 +130,8 @@ class ConversationEventProcessor:
             themes=themes
         )
     
-    async def _detect_spiritual_topic(self, text: str) -> Optional[str]:
-        """Detect the primary spiritual topic being discussed"""
+    def _score_spiritual_topics(self, text: str) -> Dict[str, int]:
+        """Count keyword matches per spiritual topic, keeping only topics that matched"""
         topic_scores = {}
         
         for topic, keywords in self.spiritual_keywords.items():
@@ -126,12 +139,9 @@ class ConversationEventProcessor:
             if score > 0:
                 topic_scores[topic] = score
         
-        if topic_scores:
-            return max(topic_scores, key=topic_scores.get)
-        
-        return None
+        return topic_scores
     
-    async def _detect_emotional_tone(self, user_input: str) -> Optional[str]:
+    def _detect_emotional_tone(self, user_input: str) -> Optional[str]:
         """Detect the emotional tone of the user's input"""
         emotion_scores = {}
         
@@ -145,7 +155,7 @@ class ConversationEventProcessor:
         
         return None
     
-    async def _detect_conversation_stage(self, user_input: str, agent_response: str) -> Optional[str]:
+    def _detect_conversation_stage(self, user_input: str, agent_response: str) -> Optional[str]:
         """Detect what stage of conversation this is"""
         combined_text = f"{user_input} {agent_response}"
         
@@ -156,25 +166,11 @@ class ConversationEventProcessor:
         # Default to deep_discussion if no specific stage detected
         return "deep_discussion"
     
-    async def _extract_bible_references(self, text: str) -> list:
+    def _extract_bible_references(self, text: str) -> list:
         """Extract bible references from text"""
-        # Simple pattern for common bible books
-        bible_pattern = r'(Matthew|Mark|Luke|John|Acts|Romans|Corinthians|Galatians|Ephesians|Philippians|Colossians|Thessalonians|Timothy|Titus|Philemon|Hebrews|James|Peter|Jude|Revelation|Psalms|Proverbs|Genesis|Exodus|Leviticus|Numbers|Deuteronomy)\s+\d+[:\d-]*'
-        
-        matches = re.findall(bible_pattern, text, re.IGNORECASE)
+        matches = _BIBLE_REFERENCE_RE.findall(text)
         return list(set(matches))
     
-    async def _extract_themes(self, text: str) -> list:
-        """Extract general spiritual themes from the conversation"""
-        themes = []
-        
-        # Look for multiple topic matches to identify themes
-        for topic, keywords in self.spiritual_keywords.items():
-            if any(keyword in text for keyword in keywords):
-                themes.append(topic)
-        
-        return themes
-    
     def _process_technical_metadata(self, metadata: Dict[str, Any]) -> TechnicalMetadata:
         """Process technical metadata for quality tracking"""
         return TechnicalMetadata(
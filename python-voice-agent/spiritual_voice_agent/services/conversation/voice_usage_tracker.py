@@ -5,6 +5,7 @@ Tracks cumulative voice minutes per user in Supabase user_profiles table.
 Integrates with conversation tracking for automatic usage updates.
 """
 import logging
+from collections import Counter
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 
@@ -26,11 +27,18 @@ class VoiceUsageTracker:
     
     def __init__(self):
         self.session_usage_cache: Dict[str, Dict[str, Any]] = {}
+        # Active session count per user, kept in step with session_usage_cache
+        self._active_sessions_by_user: Counter = Counter()
         self.supabase_service = get_supabase_conversation_service()
         logger.info("⏱️ Voice Usage Tracker initialized for billing analytics")
     
     async def start_session_tracking(self, session_id: str, user_id: str):
         """Start tracking voice usage for a session"""
+        previous = self.session_usage_cache.get(session_id)
+        if previous is not None:
+            self._release_user_session(previous["user_id"])
+        self._active_sessions_by_user[user_id] += 1
+        
         self.session_usage_cache[session_id] = {
             "user_id": user_id,
             "start_time": datetime.utcnow(),
@@ -66,11 +74,20 @@ class VoiceUsageTracker:
         
         # Clean up cache
         del self.session_usage_cache[session_id]
+        self._release_user_session(user_id)
         
         logger.info(f"⏱️ Session {session_id[:8]}... ended: {duration_seconds}s for user {user_id[:8]}...")
         
         return duration_seconds
     
+    def _release_user_session(self, user_id: str):
+        """Drop one active session from a user's running count"""
+        remaining = self._active_sessions_by_user[user_id] - 1
+        if remaining > 0:
+            self._active_sessions_by_user[user_id] = remaining
+        else:
+            self._active_sessions_by_user.pop(user_id, None)
+    
     async def _update_user_speech_time(self, user_id: str, additional_seconds: int):
         """
         Update user's cumulative speech_time in user_profiles table
@@ -104,14 +121,14 @@ class VoiceUsageTracker:
         return {
             "user_id": user_id,
             "total_speech_time_seconds": total_speech_time or 0,
-            "active_sessions": len([s for s in self.session_usage_cache.values() if s["user_id"] == user_id]),
+            "active_sessions": self._active_sessions_by_user[user_id],
             "last_session": None  # Would come from conversation_sessions
         }
     
     def get_all_usage_stats(self) -> Dict[str, Any]:
         """Get usage statistics for all users (for dashboard)"""
         active_sessions = len(self.session_usage_cache)
-        active_users = len(set(s["user_id"] for s in self.session_usage_cache.values()))
+        active_users = len(self._active_sessions_by_user)
         
         return {
             "active_sessions": active_sessions,
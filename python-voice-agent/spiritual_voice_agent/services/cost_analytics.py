@@ -20,7 +20,7 @@ import json
 import time
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import threading
@@ -31,6 +31,26 @@ from ..config.environment import get_config
 
 logger = logging.getLogger(__name__)
 
+# Most cost events the background processor stores with one database connection
+_EVENT_BATCH_SIZE = 50
+
+_INSERT_COST_EVENT_SQL = """
+    INSERT INTO cost_events (
+        session_id, user_id, character, timestamp,
+        stt_duration_ms, llm_duration_ms, tts_duration_ms, total_latency_ms,
+        transcript_text, response_text, audio_duration_seconds,
+        success, error_message
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPDATE_COST_CALCULATION_SQL = """
+    UPDATE cost_events SET
+        stt_cost = ?, llm_cost = ?, tts_cost = ?, total_cost = ?,
+        input_tokens = ?, output_tokens = ?,
+        cost_calculated = TRUE
+    WHERE id = ?
+"""
+
 
 @dataclass
 class CostEvent:
@@ -157,38 +177,45 @@ class CostAnalyticsDB:
         Cost calculations happen later in background.
         """
         with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                INSERT INTO cost_events (
-                    session_id, user_id, character, timestamp,
-                    stt_duration_ms, llm_duration_ms, tts_duration_ms, total_latency_ms,
-                    transcript_text, response_text, audio_duration_seconds,
-                    success, error_message
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                event.session_id, event.user_id, event.character, event.timestamp,
-                event.stt_duration_ms, event.llm_duration_ms, event.tts_duration_ms, event.total_latency_ms,
-                event.transcript_text, event.response_text, event.audio_duration_seconds,
-                event.success, event.error_message
-            ))
+            cursor = conn.execute(_INSERT_COST_EVENT_SQL, self._cost_event_row(event))
             return cursor.lastrowid
     
+    def insert_cost_events(self, events: List[CostEvent]) -> List[int]:
+        """Insert a batch of cost events in one transaction, returning their row ids."""
+        with sqlite3.connect(self.db_path) as conn:
+            return [
+                conn.execute(_INSERT_COST_EVENT_SQL, self._cost_event_row(event)).lastrowid
+                for event in events
+            ]
+    
+    @staticmethod
+    def _cost_event_row(event: CostEvent) -> tuple:
+        """Column values for inserting a cost event."""
+        return (
+            event.session_id, event.user_id, event.character, event.timestamp,
+            event.stt_duration_ms, event.llm_duration_ms, event.tts_duration_ms, event.total_latency_ms,
+            event.transcript_text, event.response_text, event.audio_duration_seconds,
+            event.success, event.error_message
+        )
+    
     def update_cost_calculation(self, event_id: int, costs: CalculatedCosts):
         """
         Update cost calculations for an event (background operation).
         
         This happens after voice processing is complete, ensuring zero impact.
         """
+        self.update_cost_calculations([(event_id, costs)])
+    
+    def update_cost_calculations(self, updates: List[Tuple[int, CalculatedCosts]]):
+        """Update cost calculations for a batch of events in one transaction."""
         with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                UPDATE cost_events SET
-                    stt_cost = ?, llm_cost = ?, tts_cost = ?, total_cost = ?,
-                    input_tokens = ?, output_tokens = ?,
-                    cost_calculated = TRUE
-                WHERE id = ?
-            """, (
-                costs.stt_cost, costs.llm_cost, costs.tts_cost, costs.total_cost,
-                costs.input_tokens, costs.output_tokens, event_id
-            ))
+            conn.executemany(_UPDATE_COST_CALCULATION_SQL, [
+                (
+                    costs.stt_cost, costs.llm_cost, costs.tts_cost, costs.total_cost,
+                    costs.input_tokens, costs.output_tokens, event_id
+                )
+                for event_id, costs in updates
+            ])
     
     def get_session_costs(self, session_id: str) -> List[Dict]:
         """Get all cost events for a session"""
@@ -275,14 +302,15 @@ class AsyncEventLogger:
         Log event with ZERO latency impact.
         
         This method returns immediately (microseconds).
-        All processing happens in background thread.
+        All processing happens in background thread, including validation:
+        malformed event data is not raised here, it is logged and dropped by
+        the background thread.
         """
         try:
-            # Convert dict to CostEvent (validation happens here, not in voice pipeline)
-            event = CostEvent(**event_data)
-            
-            # Put in queue without waiting - this is the key to zero latency
-            self.event_queue.put_nowait(event)
+            # Put a shallow copy in queue without waiting - this is the key to zero
+            # latency; the copy keeps later changes to the caller's dict out of the
+            # event, which is validated into a CostEvent by the background thread
+            self.event_queue.put_nowait(dict(event_data))
             
             # Method returns immediately - voice pipeline continues
             
@@ -302,24 +330,54 @@ class AsyncEventLogger:
         while not self.shutdown_flag.is_set():
             try:
                 # Get event from queue (with timeout)
-                event = self.event_queue.get(timeout=1.0)
-                
-                # Store event in database (fast operation)
-                event_id = self.db.insert_cost_event(event)
-                
-                # Calculate costs in background
-                self._calculate_costs_background(event_id, event)
-                
-                # Mark task as done
-                self.event_queue.task_done()
-                
+                batch = [self.event_queue.get(timeout=1.0)]
             except Empty:
                 # Timeout - continue loop
                 continue
+            
+            # Take whatever else is already queued, so a burst of turns is
+            # stored with one database connection instead of one per event
+            while len(batch) < _EVENT_BATCH_SIZE:
+                try:
+                    batch.append(self.event_queue.get_nowait())
+                except Empty:
+                    break
+            
+            try:
+                self._process_event_batch(batch)
             except Exception as e:
                 logger.error(f"❌ Error processing cost event: {e}")
+            finally:
+                # Mark tasks as done
+                for _ in batch:
+                    self.event_queue.task_done()
     
-    def _calculate_costs_background(self, event_id: int, event: CostEvent):
+    def _process_event_batch(self, batch: List[Dict]):
+        """Validate, store and cost a batch of queued event dicts."""
+        events = []
+        for event_data in batch:
+            try:
+                events.append(CostEvent(**event_data))
+            except TypeError as e:
+                logger.error(f"❌ Dropping invalid cost event: {e}")
+        
+        if not events:
+            return
+        
+        # Store events in database (fast operation)
+        event_ids = self.db.insert_cost_events(events)
+        
+        # Calculate costs in background and write them back together
+        updates = []
+        for event_id, event in zip(event_ids, events):
+            costs = self._calculate_costs(event_id, event)
+            if costs is not None:
+                updates.append((event_id, costs))
+        
+        if updates:
+            self.db.update_cost_calculations(updates)
+    
+    def _calculate_costs(self, event_id: int, event: CostEvent) -> Optional[CalculatedCosts]:
         """
         Calculate costs for an event in background.
         
@@ -354,13 +412,12 @@ class AsyncEventLogger:
             # 4. Calculate total cost
             costs.total_cost = costs.stt_cost + costs.llm_cost + costs.tts_cost
             
-            # 5. Update database with calculated costs
-            self.db.update_cost_calculation(event_id, costs)
-            
             logger.debug(f"💰 Calculated costs for event {event_id}: ${costs.total_cost:.4f}")
+            return costs
             
         except Exception as e:
             logger.error(f"❌ Error calculating costs for event {event_id}: {e}")
+            return None
     
     def shutdown(self):
         """Graceful shutdown of background processor"""
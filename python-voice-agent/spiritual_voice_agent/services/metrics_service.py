@@ -2,14 +2,24 @@ import asyncio
 import json
 import logging
 import time
-from datetime import datetime, timedelta
+from collections import deque
+from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 import uuid
 
 logger = logging.getLogger(__name__)
 
+
+def _parse_event_time(event: Dict[str, Any]) -> Optional[float]:
+    """Parse an event's ISO timestamp to epoch seconds, or None if it is missing or malformed."""
+    try:
+        return datetime.fromisoformat(event.get('timestamp', '')).timestamp()
+    except (ValueError, TypeError):
+        return None
+
 @dataclass
 class PipelineMetrics:
     """Pipeline stage timing breakdown"""
@@ -69,8 +79,12 @@ class MetricsService:
         self._running = False
         
         # In-memory cache for instant dashboard reads (thread-safe)
-        self._recent_events: List[Dict[str, Any]] = []
+        # Fixed-size rings: the oldest events fall off as new ones arrive
         self._max_cache_size = 1000
+        self._recent_events: Deque[Dict[str, Any]] = deque(maxlen=self._max_cache_size)
+        # Epoch-second timestamps parallel to _recent_events, so each event's ISO
+        # string is parsed once on arrival instead of on every dashboard summary
+        self._recent_event_times: Deque[Optional[float]] = deque(maxlen=self._max_cache_size)
         self._cache_lock = asyncio.Lock()
         
         # Performance counters (atomic operations)
@@ -102,25 +116,16 @@ class MetricsService:
         
         while self._running:
             try:
-                # Get batch of events (non-blocking with timeout)
-                events_batch = []
+                # Sleep until the first event arrives; cleanup() cancels this
+                # task, so an idle service never needs to wake up to poll
+                events_batch = [await self._metrics_queue.get()]
                 
-                try:
-                    # Get first event (wait up to 1 second)
-                    event = await asyncio.wait_for(self._metrics_queue.get(), timeout=1.0)
-                    events_batch.append(event)
-                    
-                    # Collect additional events if available (non-blocking)
-                    while len(events_batch) < 50:  # Process in batches up to 50
-                        try:
-                            event = self._metrics_queue.get_nowait()
-                            events_batch.append(event)
-                        except asyncio.QueueEmpty:
-                            break
-                            
-                except asyncio.TimeoutError:
-                    # No events to process, continue loop
-                    continue
+                # Collect additional events if available (non-blocking)
+                while len(events_batch) < 50:  # Process in batches up to 50
+                    try:
+                        events_batch.append(self._metrics_queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
                 
                 # Process batch of events
                 if events_batch:
@@ -130,19 +135,33 @@ class MetricsService:
                 logger.error(f"📊 Background metrics processor error: {e}")
                 await asyncio.sleep(1)  # Brief pause on error
 
-    async def _process_events_batch(self, events: List[Dict[str, Any]]):
-        """Process a batch of metrics events (runs in background)"""
+    async def _process_events_batch(self, entries: List[Tuple[float, Dict[str, Any]]]):
+        """Process a batch of (received_at, event) metrics entries (runs in background)"""
         try:
+            # Events logged without a timestamp get their ISO string here, off the
+            # voice path, from the epoch time log_event recorded; that epoch time
+            # is also their cache time, so only caller-stamped events are parsed
+            events = []
+            event_times = []
+            for received_at, event in entries:
+                if 'timestamp' in event:
+                    event_time = _parse_event_time(event)
+                else:
+                    event['timestamp'] = datetime.fromtimestamp(received_at).isoformat()
+                    event_time = received_at
+                events.append(event)
+                event_times.append(event_time)
+            
             # Ensure log file for today
             today = datetime.now().date()
             log_file = self.log_dir / f"metrics_{today.isoformat()}.jsonl"
             
-            # Write batch to file (async I/O)
+            # Write batch to file (async I/O): the whole batch is encoded into one
+            # string and appended with a single write instead of two calls per event
             def write_batch():
+                lines = ''.join(json.dumps(event, separators=(',', ':')) + '\n' for event in events)
                 with open(log_file, 'a') as f:
-                    for event in events:
-                        json.dump(event, f, separators=(',', ':'))
-                        f.write('\n')
+                    f.write(lines)
             
             # Run file I/O in thread pool
             loop = asyncio.get_event_loop()
@@ -151,11 +170,7 @@ class MetricsService:
             # Update in-memory cache (thread-safe)
             async with self._cache_lock:
                 self._recent_events.extend(events)
-                
-                # Trim cache if too large
-                if len(self._recent_events) > self._max_cache_size:
-                    trim_count = len(self._recent_events) - self._max_cache_size
-                    self._recent_events = self._recent_events[trim_count:]
+                self._recent_event_times.extend(event_times)
             
             # Update stats
             self._stats["events_processed"] += len(events)
@@ -175,13 +190,10 @@ class MetricsService:
         If queue is full, drop the event to preserve voice quality.
         """
         try:
-            # Add timestamp if not present
-            if 'timestamp' not in event_data:
-                event_data['timestamp'] = datetime.now().isoformat()
-            
-            # Try to add to queue (non-blocking)
+            # Try to add to queue (non-blocking); only the epoch time is taken
+            # here, a missing ISO timestamp is filled in by the background batch
             try:
-                self._metrics_queue.put_nowait(event_data)
+                self._metrics_queue.put_nowait((time.time(), event_data))
                 self._stats["events_queued"] += 1
             except asyncio.QueueFull:
                 # Queue full - drop event to preserve voice latency
@@ -198,25 +210,23 @@ class MetricsService:
     async def get_recent_events(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get recent events for dashboard (thread-safe)"""
         async with self._cache_lock:
-            recent = self._recent_events[-limit:] if len(self._recent_events) > limit else self._recent_events
-            return list(reversed(recent))  # Most recent first
+            return list(islice(reversed(self._recent_events), limit))  # Most recent first
 
     def get_performance_summary(self, hours: int = 1) -> Dict[str, Any]:
         """Get performance summary for dashboard (non-blocking)"""
         try:
-            cutoff_time = datetime.now() - timedelta(hours=hours)
-            
-            # Filter recent events (no async - read from cache snapshot)
-            recent_events = []
-            cache_snapshot = self._recent_events.copy()  # Atomic copy
+            cutoff_time = time.time() - hours * 3600
             
-            for event in cache_snapshot:
-                try:
-                    event_time = datetime.fromisoformat(event.get('timestamp', ''))
-                    if event_time >= cutoff_time:
-                        recent_events.append(event)
-                except (ValueError, TypeError):
-                    continue
+            # Filter recent events by their pre-parsed timestamps. The live deques
+            # are iterated without a copy or _cache_lock: every caller and the batch
+            # writer run on the event loop, and this method never awaits, so no
+            # extend() can land mid-iteration. Calling it from another thread would
+            # not be safe.
+            recent_events = [
+                event
+                for event, event_time in zip(self._recent_events, self._recent_event_times)
+                if event_time is not None and event_time >= cutoff_time
+            ]
             
             if not recent_events:
                 return {
@@ -252,13 +262,24 @@ class MetricsService:
                 stt_times = []
                 llm_times = []
                 tts_times = []
+                # Per-character tallies filled from the same pass, reusing each
+                # event's total latency instead of rescanning for every character
+                char_requests = {"adina": 0, "raffa": 0}
+                char_latencies = {"adina": [], "raffa": []}
                 
                 for event in successful_requests:
+                    character = event.get('character')
+                    tracked_character = character in char_requests
+                    if tracked_character:
+                        char_requests[character] += 1
+                    
                     pipeline = event.get('pipeline_metrics', {})
                     if isinstance(pipeline, dict):
                         total_latency = pipeline.get('total_latency_ms', 0)
                         if total_latency > 0:
                             latencies.append(total_latency)
+                            if tracked_character:
+                                char_latencies[character].append(total_latency)
                         
                         stt_latency = pipeline.get('stt_latency_ms')
                         if stt_latency and stt_latency > 0:
@@ -282,21 +303,13 @@ class MetricsService:
                 
                 # Character performance
                 character_perf = {}
-                for char in ["adina", "raffa"]:
-                    char_events = [e for e in successful_requests if e.get('character') == char]
-                    if char_events:
-                        char_latencies = []
-                        for e in char_events:
-                            pipeline = e.get('pipeline_metrics', {})
-                            if isinstance(pipeline, dict):
-                                lat = pipeline.get('total_latency_ms', 0)
-                                if lat > 0:
-                                    char_latencies.append(lat)
-                        
-                        char_avg = sum(char_latencies) / len(char_latencies) if char_latencies else 0
+                for char, requests in char_requests.items():
+                    if requests:
+                        char_lats = char_latencies[char]
+                        char_avg = sum(char_lats) / len(char_lats) if char_lats else 0
                         character_perf[char] = {
                             "avg_latency_ms": char_avg,
-                            "requests": len(char_events)
+                            "requests": requests
                         }
                     else:
                         character_perf[char] = {"avg_latency_ms": 0, "requests": 0}
@@ -8,6 +8,7 @@ configurable rules, notification channels, and alert suppression.
 import asyncio
 import time
 import logging
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass, asdict
@@ -387,14 +388,15 @@ class AlertingService:
         """Get alerting statistics"""
         active_count = len(self.active_alerts)
         total_rules = len(self.rules)
-        enabled_rules = len([rule for rule in self.rules if rule.enabled])
+        enabled_rules = sum(1 for rule in self.rules if rule.enabled)
         
-        # Count alerts by level in last 24 hours
+        # Count alerts by level in last 24 hours (one pass over the history)
         recent_alerts = self.get_alert_history(24)
+        alerts_per_level = Counter(a.level for a in recent_alerts)
         level_counts = {
-            'info': len([a for a in recent_alerts if a.level == AlertLevel.INFO]),
-            'warning': len([a for a in recent_alerts if a.level == AlertLevel.WARNING]),
-            'critical': len([a for a in recent_alerts if a.level == AlertLevel.CRITICAL])
+            'info': alerts_per_level[AlertLevel.INFO],
+            'warning': alerts_per_level[AlertLevel.WARNING],
+            'critical': alerts_per_level[AlertLevel.CRITICAL]
         }
         
         return {
@@ -116,20 +116,16 @@ class ExternalMonitoringService:
         await self.initialize()
         
         # Send to all enabled providers concurrently
-        tasks = []
-        for provider, config in self.enabled_providers.items():
-            task = self._send_to_provider(provider, config, event)
-            tasks.append(task)
-        
-        # Execute all sends concurrently
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Log any failures
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    provider = list(self.enabled_providers.keys())[i]
-                    logger.error(f"❌ Failed to send event to {provider.value}: {result}")
+        providers = list(self.enabled_providers.items())
+        results = await asyncio.gather(
+            *(self._send_to_provider(provider, config, event) for provider, config in providers),
+            return_exceptions=True
+        )
+        
+        # Log any failures (gather keeps results in provider order)
+        for (provider, _), result in zip(providers, results):
+            if isinstance(result, Exception):
+                logger.error(f"❌ Failed to send event to {provider.value}: {result}")
     
     async def _send_to_provider(self, provider: MonitoringProvider, config: Dict[str, Any], event: MonitoringEvent):
         """Send event to specific monitoring provider"""
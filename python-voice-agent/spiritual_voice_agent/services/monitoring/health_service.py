@@ -359,8 +359,8 @@ class HealthService:
         start_time = time.time()
         
         try:
-            # Get CPU usage
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            # Get CPU usage (samples for 100ms, so keep it off the event loop)
+            cpu_percent = await asyncio.to_thread(psutil.cpu_percent, interval=0.1)
             memory = psutil.virtual_memory()
             disk = psutil.disk_usage('/')
             
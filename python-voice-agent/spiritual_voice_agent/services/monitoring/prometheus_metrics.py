@@ -46,6 +46,14 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Numeric gauge values for component health statuses
+_HEALTH_STATUS_VALUES = {
+    "healthy": 1.0,
+    "warning": 0.5,
+    "critical": 0.0,
+    "unknown": -1.0
+}
+
 
 class PrometheusMetrics:
     """
@@ -284,12 +292,7 @@ class PrometheusMetrics:
         self.health_check_duration_seconds.labels(component=component).observe(duration_seconds)
         
         # Convert status to numeric value
-        status_value = {
-            "healthy": 1.0,
-            "warning": 0.5,
-            "critical": 0.0,
-            "unknown": -1.0
-        }.get(status, -1.0)
+        status_value = _HEALTH_STATUS_VALUES.get(status, -1.0)
         
         self.component_health_status.labels(component=component).set(status_value)
     
@@ -9,8 +9,10 @@ import asyncio
 import aiohttp
 import time
 import logging
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
 
@@ -76,8 +78,8 @@ class UptimeMonitor:
     def __init__(self):
         self.config = get_config()
         self.checks: List[UptimeCheck] = []
-        self.results: List[UptimeResult] = []
         self.max_results = 10000  # Keep last 10k results
+        self.results: Deque[UptimeResult] = deque(maxlen=self.max_results)
         
         self.session: Optional[aiohttp.ClientSession] = None
         self._monitoring_tasks: Dict[str, asyncio.Task] = {}
@@ -302,13 +304,9 @@ class UptimeMonitor:
             )
     
     def _store_result(self, result: UptimeResult):
-        """Store uptime check result"""
+        """Store uptime check result (the deque drops the oldest beyond max_results)"""
         self.results.append(result)
         
-        # Trim results if too many
-        if len(self.results) > self.max_results:
-            self.results = self.results[-self.max_results:]
-        
         # Log significant events
         if result.status == UptimeStatus.DOWN:
             logger.warning(f"🔴 {result.check_name} is DOWN: {result.error_message}")
@@ -317,13 +315,13 @@ class UptimeMonitor:
     
     async def _handle_status_change(self, check: UptimeCheck, result: UptimeResult):
         """Handle status changes and trigger alerts"""
-        # Get previous results for this check
-        previous_results = [r for r in self.results[-10:] if r.check_name == check.name]
+        # Get previous results for this check, newest first
+        previous_results = [r for r in islice(reversed(self.results), 10) if r.check_name == check.name]
         
         if len(previous_results) < 2:
             return  # Need at least 2 results to detect change
         
-        previous_status = previous_results[-2].status
+        previous_status = previous_results[1].status
         current_status = result.status
         
         # Detect status changes
@@ -387,7 +385,10 @@ class UptimeMonitor:
     
     def get_uptime_stats(self, hours: int = 24) -> Dict[str, Any]:
         """Get uptime statistics for specified period"""
-        cutoff = datetime.now() - timedelta(hours=hours)
+        # Results are stamped with naive datetime.now().isoformat(), which sorts
+        # chronologically as text, so convert the cutoff once instead of
+        # parsing every result's timestamp for every check
+        cutoff = (datetime.now() - timedelta(hours=hours)).isoformat()
         
         stats = {}
         
@@ -395,14 +396,31 @@ class UptimeMonitor:
             if not check.enabled:
                 continue
             
-            # Get results for this check in the time period
-            check_results = [
-                r for r in self.results
-                if r.check_name == check.name and 
-                   datetime.fromisoformat(r.timestamp) > cutoff
-            ]
+            # One pass over this check's results in the time period gathers the
+            # counts, response time total and incidents (consecutive down periods)
+            total_checks = 0
+            successful_checks = 0
+            successful_time_total = 0.0
+            incidents = 0
+            in_incident = False
+            for result in self.results:
+                if result.check_name != check.name or result.timestamp <= cutoff:
+                    continue
+                
+                total_checks += 1
+                status = result.status
+                if status == UptimeStatus.UP:
+                    successful_checks += 1
+                    successful_time_total += result.response_time_ms
+                
+                if status == UptimeStatus.DOWN:
+                    if not in_incident:
+                        incidents += 1
+                        in_incident = True
+                else:
+                    in_incident = False
             
-            if not check_results:
+            if not total_checks:
                 stats[check.name] = {
                     'uptime_percentage': 0,
                     'total_checks': 0,
@@ -412,24 +430,10 @@ class UptimeMonitor:
                 }
                 continue
             
-            total_checks = len(check_results)
-            successful_checks = len([r for r in check_results if r.status == UptimeStatus.UP])
-            uptime_percentage = (successful_checks / total_checks) * 100 if total_checks > 0 else 0
+            uptime_percentage = (successful_checks / total_checks) * 100
             
             # Calculate average response time for successful checks
-            successful_times = [r.response_time_ms for r in check_results if r.status == UptimeStatus.UP]
-            avg_response_time = sum(successful_times) / len(successful_times) if successful_times else 0
-            
-            # Count incidents (consecutive down periods)
-            incidents = 0
-            in_incident = False
-            for result in check_results:
-                if result.status == UptimeStatus.DOWN:
-                    if not in_incident:
-                        incidents += 1
-                        in_incident = True
-                else:
-                    in_incident = False
+            avg_response_time = successful_time_total / successful_checks if successful_checks else 0
             
             stats[check.name] = {
                 'uptime_percentage': round(uptime_percentage, 2),
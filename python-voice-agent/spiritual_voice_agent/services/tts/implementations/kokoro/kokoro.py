@@ -63,10 +63,21 @@ class KokoroModelSingleton:
                 # audio is already a numpy array per documentation
                 audio_chunks.append(audio)
             
-            # Concatenate all chunks
+            # Join all chunks as 16-bit PCM
             if audio_chunks:
-                # Concatenate numpy arrays
-                samples = np.concatenate(audio_chunks, axis=0)
+                # Scale and convert each chunk straight into its slot of one
+                # preallocated int16 buffer, rather than concatenating the float
+                # chunks and converting the joined copy afterwards
+                samples = np.empty(sum(len(chunk) for chunk in audio_chunks), dtype=np.int16)
+                offset = 0
+                for chunk in audio_chunks:
+                    chunk = np.asarray(chunk)
+                    end = offset + len(chunk)
+                    if chunk.dtype == np.int16:
+                        samples[offset:end] = chunk
+                    else:
+                        np.multiply(chunk, 32767, out=samples[offset:end], casting="unsafe")
+                    offset = end
                 sample_rate = 24000  # Kokoro default sample rate per docs
                 return samples, sample_rate
             else:
@@ -104,10 +115,6 @@ class KokoroTTS(tts.TTS):
                 text, self.voice, self.speed
             )
 
-            # Convert to 16-bit PCM
-            if samples.dtype != np.int16:
-                samples = (samples * 32767).astype(np.int16)
-
             logger.info(f"✅ Generated {len(samples)} samples at {sample_rate}Hz")
             
             # Create audio frame
@@ -140,16 +147,17 @@ class KokoroTTS(tts.TTS):
         raise NotImplementedError("Use asynthesize() for Kokoro TTS")
 
 
+# Character-specific voice mapping (using official Kokoro voice names from docs)
+_VOICE_MAP = {
+    "adina": "af_heart",  # Female voice for Adina (American Female)
+    "raffa": "am_adam",   # Male voice for Raffa (American Male)
+}
+
+
 def create_kokoro_tts(character: str = "adina") -> KokoroTTS:
     """Factory function to create character-specific Kokoro TTS"""
     
-    # Character-specific voice mapping (using official Kokoro voice names from docs)
-    voice_map = {
-        "adina": "af_heart",  # Female voice for Adina (American Female)
-        "raffa": "am_adam",   # Male voice for Raffa (American Male)
-    }
-    
-    voice = voice_map.get(character.lower(), "af_heart")
+    voice = _VOICE_MAP.get(character.lower(), "af_heart")
     logger.info(f"🎵 Creating Kokoro TTS with voice '{voice}' for character '{character}'")
     
     return KokoroTTS(voice=voice)
@@ -7,16 +7,52 @@ Zero-latency updates for live analytics and conversation monitoring.
 """
 
 import asyncio
-import json
 import logging
+import time
 from typing import Dict, List, Set
 from datetime import datetime
 from fastapi import WebSocket, WebSocketDisconnect
 from dataclasses import dataclass, asdict
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
+# Queue placeholder for the latest analytics snapshot held in _pending_analytics
+_ANALYTICS_PENDING = object()
+
+
+# Event timestamps are reused within this window instead of formatting a new
+# datetime for every broadcast; refreshed lazily so nothing ticks while idle
+_TIMESTAMP_RESOLUTION = 0.01
+_cached_timestamp = ""
+_cached_timestamp_at = 0.0
+
+
+def _event_timestamp() -> str:
+    """Return the current local time as ISO text, cached for _TIMESTAMP_RESOLUTION."""
+    global _cached_timestamp, _cached_timestamp_at
+    now = time.time()
+    if now - _cached_timestamp_at >= _TIMESTAMP_RESOLUTION:
+        _cached_timestamp = datetime.fromtimestamp(now).isoformat()
+        _cached_timestamp_at = now
+    return _cached_timestamp
+
+
+# The connection confirmation only varies by timestamp and client count, so it is
+# filled into pre-serialized JSON instead of building and encoding a dict per connect
+_CONNECTION_ESTABLISHED_TEMPLATE = (
+    '{{"event_type":"connection_established","timestamp":"{timestamp}",'
+    '"message":"Real-time dashboard connected","active_connections":{active_connections}}}'
+)
+
+
+def _dumps(data: Dict) -> str:
+    """Serialize a dashboard event to JSON text with orjson."""
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 @dataclass
 class ConversationEvent:
     """Real-time conversation event for dashboard."""
@@ -61,16 +97,20 @@ class WebSocketManager:
         self.event_queue = asyncio.Queue()
         self.broadcast_task = None
         
+        # Newest analytics snapshot not yet broadcast (older ones are superseded)
+        self._pending_analytics: AnalyticsEvent = None
+        
         logger.info("🔌 WebSocket Manager initialized for real-time dashboard")
     
     async def connect(self, websocket: WebSocket, client_info: Dict = None):
         """Accept new WebSocket connection."""
         await websocket.accept()
         self.active_connections.add(websocket)
+        connected_at = datetime.now()
         
-        # Store client metadata
+        # Store client metadata (kept as a datetime; only formatted when sent)
         self.connection_info[websocket] = {
-            "connected_at": datetime.now().isoformat(),
+            "connected_at": connected_at,
             "client_info": client_info or {},
             "events_sent": 0
         }
@@ -82,12 +122,10 @@ class WebSocketManager:
         logger.info(f"🔌 Dashboard client connected (total: {len(self.active_connections)})")
         
         # Send initial connection confirmation
-        await self._send_to_client(websocket, {
-            "event_type": "connection_established",
-            "timestamp": datetime.now().isoformat(),
-            "message": "Real-time dashboard connected",
-            "active_connections": len(self.active_connections)
-        })
+        await self._send_message(websocket, _CONNECTION_ESTABLISHED_TEMPLATE.format(
+            timestamp=connected_at.isoformat(),
+            active_connections=len(self.active_connections)
+        ))
     
     async def disconnect(self, websocket: WebSocket):
         """Remove WebSocket connection."""
@@ -95,9 +133,7 @@ class WebSocketManager:
             self.active_connections.remove(websocket)
             
         if websocket in self.connection_info:
-            connection_duration = datetime.now() - datetime.fromisoformat(
-                self.connection_info[websocket]["connected_at"]
-            )
+            connection_duration = datetime.now() - self.connection_info[websocket]["connected_at"]
             events_sent = self.connection_info[websocket]["events_sent"]
             del self.connection_info[websocket]
             
@@ -117,15 +153,34 @@ class WebSocketManager:
             return
             
         await self.event_queue.put(event)
-        logger.debug(f"📡 Queued conversation event: {event.event_type}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"📡 Queued conversation event: {event.event_type}")
+    
+    async def broadcast_json(self, data: Dict):
+        """Broadcast a plain JSON message to all connected dashboards."""
+        if not self.active_connections:
+            logger.debug("📡 No dashboard connections - skipping broadcast")
+            return
+        
+        # Encode on enqueue so the worker sends the text as-is instead of
+        # keeping the dict around to serialize later
+        await self.event_queue.put(_dumps(data))
     
     async def broadcast_analytics_update(self, analytics: AnalyticsEvent):
         """Broadcast analytics update to all connected dashboards."""
         if not self.active_connections:
             logger.debug("📊 No dashboard connections - skipping analytics")
             return
+        
+        # Analytics are snapshots: if one is still waiting to go out, replace it
+        # rather than queueing another, so bursts collapse into one send
+        already_queued = self._pending_analytics is not None
+        self._pending_analytics = analytics
+        if already_queued:
+            logger.debug("📊 Coalesced analytics update")
+            return
             
-        await self.event_queue.put(analytics)
+        await self.event_queue.put(_ANALYTICS_PENDING)
         logger.debug(f"📊 Queued analytics update")
     
     async def _broadcast_worker(self):
@@ -136,34 +191,46 @@ class WebSocketManager:
             while True:
                 # Get next event from queue
                 event = await self.event_queue.get()
+                if event is _ANALYTICS_PENDING:
+                    event, self._pending_analytics = self._pending_analytics, None
                 
-                # Convert to dict for JSON serialization
-                if hasattr(event, '__dict__'):
-                    event_data = asdict(event)
+                if isinstance(event, str):
+                    # broadcast_json events are queued already serialized
+                    message = event
+                    event_type = "relayed"
                 else:
-                    event_data = event
+                    # Convert to dict for JSON serialization
+                    if hasattr(event, '__dict__'):
+                        event_data = asdict(event)
+                    else:
+                        event_data = event
+                    
+                    # Serialize once; every client gets the same frame
+                    message = _dumps(event_data)
+                    event_type = event_data.get('event_type', 'unknown')
                 
                 # Broadcast to all connected clients
                 disconnected_clients = []
+                active_connections = self.active_connections
                 
-                for websocket in self.active_connections.copy():
-                    try:
-                        await self._send_to_client(websocket, event_data)
+                for websocket in active_connections.copy():
+                    # active_connections is the cached connected flag: the dashboard
+                    # endpoint's finally and failed sends both remove a socket through
+                    # disconnect(), so skip any that went away during this broadcast
+                    if websocket not in active_connections:
+                        continue
+                    
+                    if await self._safe_send(websocket, message):
                         self.connection_info[websocket]["events_sent"] += 1
-                        
-                    except WebSocketDisconnect:
-                        logger.info("🔌 Client disconnected during broadcast")
-                        disconnected_clients.append(websocket)
-                        
-                    except Exception as e:
-                        logger.error(f"❌ Error broadcasting to client: {e}")
+                    else:
                         disconnected_clients.append(websocket)
                 
                 # Clean up disconnected clients
                 for websocket in disconnected_clients:
                     await self.disconnect(websocket)
                 
-                logger.debug(f"📡 Broadcasted {event_data.get('event_type', 'unknown')} to {len(self.active_connections)} clients")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"📡 Broadcasted {event_type} to {len(self.active_connections)} clients")
                 
         except asyncio.CancelledError:
             logger.info("📡 WebSocket broadcast worker stopped")
@@ -173,12 +240,27 @@ class WebSocketManager:
     
     async def _send_to_client(self, websocket: WebSocket, data: Dict):
         """Send data to a specific WebSocket client."""
+        await self._send_message(websocket, _dumps(data))
+    
+    async def _send_message(self, websocket: WebSocket, message: str):
+        """Send an already-serialized JSON message to a specific WebSocket client."""
         try:
-            await websocket.send_text(json.dumps(data))
+            await websocket.send_text(message)
         except Exception as e:
             logger.error(f"❌ Failed to send to client: {e}")
             raise
     
+    async def _safe_send(self, websocket: WebSocket, message: str) -> bool:
+        """Send a serialized message during broadcast; returns False if the client should be dropped."""
+        try:
+            await websocket.send_text(message)
+            return True
+        except WebSocketDisconnect:
+            logger.info("🔌 Client disconnected during broadcast")
+        except Exception as e:
+            logger.error(f"❌ Error broadcasting to client: {e}")
+        return False
+    
     def get_connection_stats(self) -> Dict:
         """Get WebSocket connection statistics."""
         total_events_sent = sum(
@@ -212,7 +294,7 @@ async def broadcast_conversation_start(session_id: str, user_id: str, metadata:
     """Broadcast conversation start event."""
     event = ConversationEvent(
         event_type="session_start",
-        timestamp=datetime.now().isoformat(),
+        timestamp=_event_timestamp(),
         session_id=session_id,
         user_id=user_id,
         data=metadata or {}
@@ -226,7 +308,7 @@ async def broadcast_conversation_turn(session_id: str, user_id: str, turn_data:
     """Broadcast conversation turn event."""
     event = ConversationEvent(
         event_type="turn_completed",
-        timestamp=datetime.now().isoformat(),
+        timestamp=_event_timestamp(),
         session_id=session_id,
         user_id=user_id,
         data=turn_data
@@ -240,7 +322,7 @@ async def broadcast_conversation_end(session_id: str, user_id: str, summary: Dic
     """Broadcast conversation end event."""
     event = ConversationEvent(
         event_type="session_end",
-        timestamp=datetime.now().isoformat(),
+        timestamp=_event_timestamp(),
         session_id=session_id,
         user_id=user_id,
         data=summary or {}
@@ -253,7 +335,7 @@ async def broadcast_conversation_end(session_id: str, user_id: str, summary: Dic
 async def broadcast_analytics_update(analytics_data: Dict):
     """Broadcast analytics update to dashboard."""
     analytics = AnalyticsEvent(
-        timestamp=datetime.now().isoformat(),
+        timestamp=_event_timestamp(),
         active_users=analytics_data.get("active_users", 0),
         active_sessions=analytics_data.get("active_sessions", 0),
         total_turns_today=analytics_data.get("total_turns_today", 0),
@@ -0,0 +1,75 @@
+"""
+Unit tests for the cross-worker voice config sync in routes/voice_config.py.
+
+Each uvicorn worker keeps its own copy of the voice config and re-stats the
+shared config file at most once per TTL window, reloading it when another
+worker has replaced it.
+"""
+
+import os
+
+import orjson
+import pytest
+
+from spiritual_voice_agent.routes import voice_config
+
+
+class FakeClock:
+    """Stands in for time.monotonic so the sync TTL can be stepped over"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """Point the module at a temp config file holding Adina, already synced"""
+    path = tmp_path / "current_voice_config.json"
+    monkeypatch.setattr(voice_config, "_CONFIG_FILE", path)
+    monkeypatch.setattr(voice_config, "_CONFIG_SYNC", [float("-inf"), None])
+    monkeypatch.setattr(
+        voice_config, "current_voice_config", dict(voice_config.VOICE_CONFIGURATIONS["adina"])
+    )
+
+    clock = FakeClock()
+    monkeypatch.setattr(voice_config.time, "monotonic", clock)
+
+    write_as_other_worker(path, "adina", mtime_ns=1_000_000_000)
+    voice_config._sync_voice_config_from_file(force=True)
+    assert voice_config.get_current_voice_config()["character"] == "adina"
+    return path, clock
+
+
+def write_as_other_worker(path, character, mtime_ns):
+    """Replace the config file the way another worker's switch_voice would"""
+    voice_config._write_config_atomic(
+        path, orjson.dumps(dict(voice_config.VOICE_CONFIGURATIONS[character]))
+    )
+    # Pin the mtime so the change is visible regardless of filesystem timestamp resolution
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_switch_from_other_worker_is_picked_up_after_ttl(config_file):
+    path, clock = config_file
+    write_as_other_worker(path, "raffa", mtime_ns=2_000_000_000)
+
+    # Still inside the TTL window: the file isn't re-stat'ed yet
+    clock.now += voice_config._CONFIG_SYNC_TTL / 2
+    assert voice_config.get_current_voice_config()["character"] == "adina"
+
+    clock.now += voice_config._CONFIG_SYNC_TTL
+    config = voice_config.get_current_voice_config()
+    assert config["character"] == "raffa"
+    assert config["voice"] == voice_config.VOICE_CONFIGURATIONS["raffa"]["voice"]
+
+
+def test_force_sync_bypasses_ttl(config_file):
+    path, clock = config_file
+    write_as_other_worker(path, "raffa", mtime_ns=2_000_000_000)
+
+    voice_config._sync_voice_config_from_file(force=True)
+
+    assert voice_config.get_current_voice_config()["character"] == "raffa"